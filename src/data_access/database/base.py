@@ -10,7 +10,8 @@ Date: 2025
 
 import logging
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, List, Optional, Dict, Any, Type, Union
+from contextlib import contextmanager
+from typing import TypeVar, Generic, Generator, List, Optional, Dict, Any, Type, Union
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import and_, or_, desc, asc, func
@@ -43,6 +44,23 @@ class BaseRepository(Generic[ModelType], ABC):
         """
         self.model = model
     
+    @contextmanager
+    def unit_of_work(self) -> Generator[Session, None, None]:
+        """
+        Context manager sharing one transaction across several repository calls.
+        
+        Every method accepts an optional ``session``; without one, each call
+        opens and commits its own transaction. Pass the session yielded here
+        to chain calls inside a single BEGIN/COMMIT.
+        
+        Usage:
+            with repo.unit_of_work() as session:
+                user = repo.get_by_email(email, session)
+                repo.update_last_login(user.id, session)
+        """
+        with get_db_transaction() as session:
+            yield session
+    
     # Abstract methods that must be implemented by subclasses
     @abstractmethod
     def create(self, obj_in: CreateSchemaType, session: Optional[Session] = None) -> ModelType:
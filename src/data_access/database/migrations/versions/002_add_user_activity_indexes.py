@@ -0,0 +1,32 @@
+"""Add indexes backing user activity listings
+
+Revision ID: 002
+Revises:
+Create Date: 2025-09-20 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create indexes for recent, inactive and active user queries."""
+    op.create_index('ix_users_created_at_desc', 'users', [sa.text('created_at DESC')])
+    op.create_index('ix_users_active_lastlogin', 'users', ['is_active', 'last_login'])
+    op.create_index(
+        'ix_users_active', 'users', ['is_active'],
+        postgresql_where=sa.text('is_active = true')
+    )
+
+
+def downgrade() -> None:
+    """Drop user activity indexes."""
+    op.drop_index('ix_users_active', table_name='users')
+    op.drop_index('ix_users_active_lastlogin', table_name='users')
+    op.drop_index('ix_users_created_at_desc', table_name='users')
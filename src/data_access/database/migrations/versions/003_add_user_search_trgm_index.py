@@ -0,0 +1,41 @@
+"""Add trigram index for user search
+
+Revision ID: 003
+Revises: 002
+Create Date: 2025-09-20 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+# Must stay in sync with search_text_expression() in the User model
+USER_SEARCH_EXPRESSION = (
+    "(email || ' ' || coalesce(username, '') || ' ' || "
+    "coalesce(first_name, '') || ' ' || coalesce(last_name, ''))"
+)
+
+
+def upgrade() -> None:
+    """Create pg_trgm GIN index over the user search text (PostgreSQL only)."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        f'CREATE INDEX ix_users_search_trgm ON users '
+        f'USING gin ({USER_SEARCH_EXPRESSION} gin_trgm_ops)'
+    )
+
+
+def downgrade() -> None:
+    """Drop the user search trigram index."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute('DROP INDEX IF EXISTS ix_users_search_trgm')
@@ -0,0 +1,25 @@
+"""Add JSON preferences column to users
+
+Revision ID: 004
+Revises: 003
+Create Date: 2025-09-20 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the users.preferences column."""
+    op.add_column('users', sa.Column('preferences', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop the users.preferences column."""
+    op.drop_column('users', 'preferences')
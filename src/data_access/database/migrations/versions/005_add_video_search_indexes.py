@@ -0,0 +1,41 @@
+"""Add full-text and trigram indexes for video search
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-09-20 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+# Must stay in sync with search_vector_expression() in the Video model
+VIDEO_SEARCH_VECTOR = (
+    "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))"
+)
+
+
+def upgrade() -> None:
+    """Create full-text and pg_trgm GIN indexes over video text (PostgreSQL only)."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(f'CREATE INDEX ix_videos_search_tsv ON videos USING gin ({VIDEO_SEARCH_VECTOR})')
+    op.execute('CREATE INDEX ix_videos_title_trgm ON videos USING gin (title gin_trgm_ops)')
+    op.execute('CREATE INDEX ix_videos_description_trgm ON videos USING gin (description gin_trgm_ops)')
+
+
+def downgrade() -> None:
+    """Drop video search indexes."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute('DROP INDEX IF EXISTS ix_videos_description_trgm')
+    op.execute('DROP INDEX IF EXISTS ix_videos_title_trgm')
+    op.execute('DROP INDEX IF EXISTS ix_videos_search_tsv')
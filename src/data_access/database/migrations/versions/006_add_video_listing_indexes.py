@@ -0,0 +1,34 @@
+"""Add partial indexes for live video listings
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-09-20 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create partial indexes over non-deleted videos."""
+    op.create_index(
+        'ix_videos_live_short_views', 'videos', ['is_short', sa.text('view_count DESC')],
+        postgresql_where=sa.text('is_deleted = false')
+    )
+    op.create_index(
+        'ix_videos_live_published', 'videos', [sa.text('published_at DESC')],
+        postgresql_include=['view_count'],
+        postgresql_where=sa.text('is_deleted = false')
+    )
+
+
+def downgrade() -> None:
+    """Drop live video listing indexes."""
+    op.drop_index('ix_videos_live_published', table_name='videos')
+    op.drop_index('ix_videos_live_short_views', table_name='videos')
@@ -0,0 +1,29 @@
+"""Add partial index for trending video lookups
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-09-20 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create partial index over live videos with views."""
+    op.create_index(
+        'ix_videos_recent_trending', 'videos', [sa.text('published_at DESC')],
+        postgresql_include=['view_count'],
+        postgresql_where=sa.text('is_deleted = false AND view_count > 0')
+    )
+
+
+def downgrade() -> None:
+    """Drop the trending video index."""
+    op.drop_index('ix_videos_recent_trending', table_name='videos')
@@ -0,0 +1,29 @@
+"""Add channel timeline index for keyset pagination
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-09-20 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create partial (channel_id, published_at DESC, id DESC) index over live videos."""
+    op.create_index(
+        'ix_videos_channel_published', 'videos',
+        ['channel_id', sa.text('published_at DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text('is_deleted = false')
+    )
+
+
+def downgrade() -> None:
+    """Drop the channel timeline index."""
+    op.drop_index('ix_videos_channel_published', table_name='videos')
@@ -1,13 +1,21 @@
 """Base model classes for ViewTrendsSL database models."""
 
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, DDL, event
 from sqlalchemy.sql import func
 from datetime import datetime
 
 # Create the declarative base
 Base = declarative_base()
 
+# The trigram search indexes declared on the models need pg_trgm; create it
+# first so Base.metadata.create_all() builds them on a fresh database
+event.listen(
+    Base.metadata,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql')
+)
+
 
 class TimestampMixin:
     """Mixin to add created_at and updated_at timestamps to models."""
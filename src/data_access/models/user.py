@@ -1,7 +1,8 @@
 """User model for authentication and user management."""
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, Index, text, func, literal_column
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.mutable import MutableDict
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime, timedelta
 from typing import Optional
@@ -11,6 +12,23 @@ import os
 from .base import BaseModel
 
 
+def search_text_expression(email, username, first_name, last_name):
+    """Build the concatenated text expression used for user search.
+    
+    Shared by the ix_users_search_trgm index and the user repository's
+    search queries; literal separators are rendered inline (not as bound
+    parameters) so queries match the index definition exactly.
+    """
+    space = literal_column("' '")
+    empty = literal_column("''")
+    return (
+        email + space
+        + func.coalesce(username, empty) + space
+        + func.coalesce(first_name, empty) + space
+        + func.coalesce(last_name, empty)
+    )
+
+
 class User(BaseModel):
     """User model for authentication and user management.
     
@@ -47,6 +65,8 @@ class User(BaseModel):
     timezone = Column(String(50), nullable=True, default='UTC')
     language = Column(String(10), nullable=True, default='en')
     email_notifications = Column(Boolean, nullable=False, default=True)
+    # MutableDict tracks in-place edits, so the blob needn't be reassigned
+    preferences = Column(MutableDict.as_mutable(JSON), nullable=True)
     
     # API usage tracking
     api_requests_today = Column(Integer, nullable=False, default=0)
@@ -57,6 +77,20 @@ class User(BaseModel):
     website = Column(String(255), nullable=True)
     avatar_url = Column(String(500), nullable=True)
     
+    # Indexes backing the recent/inactive/active user listings and, on
+    # PostgreSQL, the trigram index backing user search (migration 003)
+    __table_args__ = (
+        Index('ix_users_created_at_desc', text('created_at DESC')),
+        Index('ix_users_active_lastlogin', 'is_active', 'last_login'),
+        Index('ix_users_active', 'is_active', postgresql_where=text('is_active = true')),
+        Index(
+            'ix_users_search_trgm',
+            search_text_expression(email, username, first_name, last_name).label('search_text'),
+            postgresql_using='gin',
+            postgresql_ops={'search_text': 'gin_trgm_ops'}
+        ).ddl_if(dialect='postgresql'),
+    )
+    
     def __init__(self, email: str, password: str, **kwargs):
         """Initialize a new user with email and password."""
         super().__init__(**kwargs)
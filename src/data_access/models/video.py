@@ -1,6 +1,6 @@
 """Video model for YouTube video data."""
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, BigInteger, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, BigInteger, Float, ForeignKey, Index, text, func, literal_column
 from sqlalchemy.orm import relationship
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
@@ -10,6 +10,20 @@ import re
 from . import BaseModel
 
 
+def search_vector_expression(title, description):
+    """Build the tsvector expression used for full-text video search.
+    
+    Shared by the ix_videos_search_tsv index and the video repository's
+    search query, so PostgreSQL can match the expression index.
+    """
+    return func.to_tsvector(
+        literal_column("'english'"),
+        func.coalesce(title, literal_column("''"))
+        + literal_column("' '")
+        + func.coalesce(description, literal_column("''"))
+    )
+
+
 class Video(BaseModel):
     """YouTube Video model for storing video metadata and statistics.
     
@@ -91,6 +105,45 @@ class Video(BaseModel):
     is_deleted = Column(Boolean, nullable=False, default=False)
     is_private = Column(Boolean, nullable=False, default=False)
     
+    # Partial indexes over live videos for the Shorts/long-form listings and
+    # the date-bounded trending, tracking and training queries; on PostgreSQL
+    # also the full-text and trigram indexes backing search (migration 005)
+    __table_args__ = (
+        Index(
+            'ix_videos_live_short_views', 'is_short', text('view_count DESC'),
+            postgresql_where=text('is_deleted = false')
+        ),
+        Index(
+            'ix_videos_live_published', text('published_at DESC'),
+            postgresql_include=['view_count'],
+            postgresql_where=text('is_deleted = false')
+        ),
+        Index(
+            'ix_videos_recent_trending', text('published_at DESC'),
+            postgresql_include=['view_count'],
+            postgresql_where=text('is_deleted = false AND view_count > 0')
+        ),
+        Index(
+            'ix_videos_channel_published', 'channel_id', text('published_at DESC'), text('id DESC'),
+            postgresql_where=text('is_deleted = false')
+        ),
+        Index(
+            'ix_videos_search_tsv',
+            search_vector_expression(title, description),
+            postgresql_using='gin'
+        ).ddl_if(dialect='postgresql'),
+        Index(
+            'ix_videos_title_trgm', 'title',
+            postgresql_using='gin',
+            postgresql_ops={'title': 'gin_trgm_ops'}
+        ).ddl_if(dialect='postgresql'),
+        Index(
+            'ix_videos_description_trgm', 'description',
+            postgresql_using='gin',
+            postgresql_ops={'description': 'gin_trgm_ops'}
+        ).ddl_if(dialect='postgresql'),
+    )
+    
     # Relationships
     channel = relationship("Channel", back_populates="videos")
     snapshots = relationship("Snapshot", back_populates="video", cascade="all, delete-orphan")
@@ -267,33 +320,52 @@ class Video(BaseModel):
         
         return features
     
-    def calculate_data_quality_score(self) -> float:
-        """Calculate data quality score based on available information."""
+    # Columns read by score_data_quality, so callers can select just these
+    QUALITY_SCORE_FIELDS = (
+        'title', 'description', 'published_at', 'duration_seconds', 'category_name',
+        'view_count', 'like_count', 'comment_count', 'last_stats_update', 'tags', 'tag_count'
+    )
+    
+    @staticmethod
+    def score_data_quality(record: Any, now: Optional[datetime] = None) -> float:
+        """Score data quality for any object exposing QUALITY_SCORE_FIELDS.
+        
+        Args:
+            record: Video instance or row with the quality score columns
+            now: Reference time for the freshness check (defaults to utcnow)
+            
+        Returns:
+            Data quality score between 0.0 and 1.0
+        """
         score = 0.0
         max_score = 10.0
         
         # Basic information
-        if self.title: score += 1.0
-        if self.description: score += 1.0
-        if self.published_at: score += 1.0
-        if self.duration_seconds: score += 1.0
-        if self.category_name: score += 1.0
+        if record.title: score += 1.0
+        if record.description: score += 1.0
+        if record.published_at: score += 1.0
+        if record.duration_seconds: score += 1.0
+        if record.category_name: score += 1.0
         
         # Statistics
-        if self.view_count is not None: score += 1.0
-        if self.like_count is not None: score += 1.0
-        if self.comment_count is not None: score += 1.0
+        if record.view_count is not None: score += 1.0
+        if record.like_count is not None: score += 1.0
+        if record.comment_count is not None: score += 1.0
         
         # Recent update
-        if self.last_stats_update:
-            hours_since_update = (datetime.utcnow() - self.last_stats_update).total_seconds() / 3600
+        if record.last_stats_update:
+            hours_since_update = ((now or datetime.utcnow()) - record.last_stats_update).total_seconds() / 3600
             if hours_since_update <= 24: score += 1.0
             elif hours_since_update <= 168: score += 0.5  # 1 week
         
         # Content features
-        if self.tags and self.tag_count and self.tag_count > 0: score += 1.0
+        if record.tags and record.tag_count and record.tag_count > 0: score += 1.0
         
-        self.data_quality_score = score / max_score
+        return score / max_score
+    
+    def calculate_data_quality_score(self) -> float:
+        """Calculate data quality score based on available information."""
+        self.data_quality_score = self.score_data_quality(self)
         return self.data_quality_score
     
     def to_dict(self, include_stats: bool = True, include_features: bool = False) -> Dict[str, Any]:
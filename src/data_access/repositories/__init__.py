@@ -8,14 +8,10 @@ from .base_repository import BaseRepository
 from .user.user_repository import UserRepository
 from .channel.channel_repository import ChannelRepository
 from .video.video_repository import VideoRepository
-from .snapshot.snapshot_repository import SnapshotRepository
-from .tag.tag_repository import TagRepository
 
 __all__ = [
     'BaseRepository',
     'UserRepository',
     'ChannelRepository',
-    'VideoRepository',
-    'SnapshotRepository',
-    'TagRepository'
+    'VideoRepository'
 ]
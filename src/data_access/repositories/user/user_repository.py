@@ -9,19 +9,40 @@ Date: 2025
 """
 
 import logging
-from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+import threading
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy import and_, or_, func
 
 from src.data_access.database.base import AdvancedRepository
-from src.data_access.models.user import User
+from src.data_access.models.user import User, search_text_expression
 from src.business.utils.time_utils import get_current_utc_time
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+# Minimum interval between last_login writes on authentication
+LAST_LOGIN_WRITE_INTERVAL = timedelta(minutes=5)
+
+
+def _is_login_write_due(last_login: Optional[datetime], now: datetime) -> bool:
+    """Check whether last_login is stale enough to be rewritten."""
+    if last_login is None:
+        return True
+    if last_login.tzinfo is None:
+        # Naive values come back from DateTime columns; they are stored as UTC
+        last_login = last_login.replace(tzinfo=timezone.utc)
+    return now - last_login > LAST_LOGIN_WRITE_INTERVAL
+
+
+def _user_search_text():
+    """Build the user search expression matching the ix_users_search_trgm index."""
+    return search_text_expression(User.email, User.username, User.first_name, User.last_name)
+
+
 class UserCreateSchema:
     """Schema for creating a new user."""
     
@@ -95,6 +116,7 @@ class UserRepository(AdvancedRepository[User]):
                     raise ValueError(f"User with username {obj_in.username} already exists")
             
             # Create new user
+            now = get_current_utc_time()
             db_user = User(
                 email=obj_in.email,
                 username=obj_in.username,
@@ -102,8 +124,8 @@ class UserRepository(AdvancedRepository[User]):
                 password_hash=obj_in.password_hash,
                 is_active=obj_in.is_active,
                 user_type=obj_in.user_type,
-                created_at=get_current_utc_time(),
-                updated_at=get_current_utc_time()
+                created_at=now,
+                updated_at=now
             )
             
             session.add(db_user)
@@ -134,10 +156,12 @@ class UserRepository(AdvancedRepository[User]):
             # Update fields if provided
             if obj_in.username is not None:
                 # Check if username is already taken by another user
-                existing_user = session.query(User).filter(
-                    and_(User.username == obj_in.username, User.id != db_obj.id)
-                ).first()
-                if existing_user:
+                taken = session.query(
+                    session.query(User).filter(
+                        and_(User.username == obj_in.username, User.id != db_obj.id)
+                    ).exists()
+                ).scalar()
+                if taken:
                     raise ValueError(f"Username {obj_in.username} is already taken")
                 db_obj.username = obj_in.username
             
@@ -146,10 +170,12 @@ class UserRepository(AdvancedRepository[User]):
             
             if obj_in.email is not None:
                 # Check if email is already taken by another user
-                existing_user = session.query(User).filter(
-                    and_(User.email == obj_in.email, User.id != db_obj.id)
-                ).first()
-                if existing_user:
+                taken = session.query(
+                    session.query(User).filter(
+                        and_(User.email == obj_in.email, User.id != db_obj.id)
+                    ).exists()
+                ).scalar()
+                if taken:
                     raise ValueError(f"Email {obj_in.email} is already taken")
                 db_obj.email = obj_in.email
             
@@ -203,6 +229,57 @@ class UserRepository(AdvancedRepository[User]):
         """
         return self.get_by_field('username', username, session)
     
+    def get_by_emails(self, emails: List[str], session: Optional[Session] = None) -> Dict[str, User]:
+        """
+        Get multiple users by email address in a single query.
+        
+        Args:
+            emails: Email addresses to look up (matched case-insensitively)
+            session: Optional database session
+            
+        Returns:
+            Dictionary mapping normalized (lowercased) email to User for
+            every user found
+        """
+        def _get_by_emails(session: Session) -> Dict[str, User]:
+            # Emails are stored lowercased, see User.__init__
+            normalized = {email.strip().lower() for email in emails}
+            if not normalized:
+                return {}
+            users = session.query(User).filter(User.email.in_(normalized)).all()
+            return {user.email: user for user in users}
+        
+        if session:
+            return _get_by_emails(session)
+        else:
+            from src.data_access.database.session import get_db_session
+            with get_db_session() as session:
+                return _get_by_emails(session)
+    
+    def get_by_ids(self, ids: List[int], session: Optional[Session] = None) -> Dict[int, User]:
+        """
+        Get multiple users by ID in a single query.
+        
+        Args:
+            ids: User IDs to look up
+            session: Optional database session
+            
+        Returns:
+            Dictionary mapping ID to User for every user found
+        """
+        def _get_by_ids(session: Session) -> Dict[int, User]:
+            if not ids:
+                return {}
+            users = session.query(User).filter(User.id.in_(set(ids))).all()
+            return {user.id: user for user in users}
+        
+        if session:
+            return _get_by_ids(session)
+        else:
+            from src.data_access.database.session import get_db_session
+            with get_db_session() as session:
+                return _get_by_ids(session)
+    
     def get_active_users(
         self, 
         skip: int = 0, 
@@ -270,9 +347,17 @@ class UserRepository(AdvancedRepository[User]):
             ).first()
             
             if user:
-                # Update last login time
-                user.last_login = get_current_utc_time()
-                user.updated_at = get_current_utc_time()
+                # Update last login time, throttled for clients that
+                # re-authenticate on every request
+                now = get_current_utc_time()
+                if _is_login_write_due(user.last_login, now):
+                    # Pin updated_at to itself so its onupdate default does
+                    # not fire: a login is not a profile change
+                    session.query(User).filter(User.id == user.id).update(
+                        {User.last_login: now, User.updated_at: User.updated_at},
+                        synchronize_session=False
+                    )
+                    set_committed_value(user, 'last_login', now)
                 logger.info(f"User authenticated: {email}")
             else:
                 logger.warning(f"Authentication failed for email: {email}")
@@ -298,10 +383,11 @@ class UserRepository(AdvancedRepository[User]):
             True if updated successfully, False otherwise
         """
         def _update_last_login(session: Session) -> bool:
-            user = session.query(User).filter(User.id == user_id).first()
+            user = session.get(User, user_id)
             if user:
-                user.last_login = get_current_utc_time()
-                user.updated_at = get_current_utc_time()
+                now = get_current_utc_time()
+                user.last_login = now
+                user.updated_at = now
                 return True
             return False
         
@@ -324,7 +410,7 @@ class UserRepository(AdvancedRepository[User]):
             True if deactivated successfully, False otherwise
         """
         def _deactivate(session: Session) -> bool:
-            user = session.query(User).filter(User.id == user_id).first()
+            user = session.get(User, user_id)
             if user:
                 user.is_active = False
                 user.updated_at = get_current_utc_time()
@@ -351,7 +437,7 @@ class UserRepository(AdvancedRepository[User]):
             True if activated successfully, False otherwise
         """
         def _activate(session: Session) -> bool:
-            user = session.query(User).filter(User.id == user_id).first()
+            user = session.get(User, user_id)
             if user:
                 user.is_active = True
                 user.updated_at = get_current_utc_time()
@@ -464,8 +550,67 @@ class UserRepository(AdvancedRepository[User]):
         Returns:
             List of matching User instances
         """
-        search_fields = ['email', 'username', 'full_name']
-        return self.search(search_term, search_fields, skip, limit, session)
+        def _search(session: Session) -> List[User]:
+            # Matches the ix_users_search_trgm expression so PostgreSQL can
+            # answer the substring match from the trigram index
+            return session.query(User).filter(
+                _user_search_text().ilike(f'%{search_term}%')
+            ).offset(skip).limit(limit).all()
+        
+        if session:
+            return _search(session)
+        else:
+            from src.data_access.database.session import get_db_session
+            with get_db_session() as session:
+                return _search(session)
+    
+    def list_users_lite(
+        self,
+        search_term: Optional[str] = None,
+        active_only: bool = True,
+        skip: int = 0,
+        limit: int = 100,
+        session: Optional[Session] = None
+    ) -> List[Tuple]:
+        """
+        List users as lightweight row tuples for listing endpoints.
+        
+        Selects only the columns list views display, so no User instances
+        are constructed or tracked by the session.
+        
+        Args:
+            search_term: Optional term to match against email, username and name
+            active_only: Whether to restrict the listing to active users
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            session: Optional database session
+            
+        Returns:
+            List of (id, email, username, first_name, last_name, is_active) rows
+        """
+        def _list_lite(session: Session) -> List[Tuple]:
+            query = session.query(
+                User.id,
+                User.email,
+                User.username,
+                User.first_name,
+                User.last_name,
+                User.is_active
+            )
+            
+            if active_only:
+                query = query.filter(User.is_active == True)
+            if search_term:
+                query = query.filter(_user_search_text().ilike(f'%{search_term}%'))
+            
+            return query.order_by(User.id).offset(skip).limit(limit).all()
+        
+        if session:
+            return _list_lite(session)
+        else:
+            from src.data_access.database.session import get_db_session
+            with get_db_session() as session:
+                return _list_lite(session)
     
     def update_user_preferences(
         self, 
@@ -485,12 +630,14 @@ class UserRepository(AdvancedRepository[User]):
             True if updated successfully, False otherwise
         """
         def _update_preferences(session: Session) -> bool:
-            user = session.query(User).filter(User.id == user_id).first()
+            user = session.get(User, user_id)
             if user:
-                # Merge with existing preferences
-                current_prefs = user.preferences or {}
-                current_prefs.update(preferences)
-                user.preferences = current_prefs
+                # Merge with existing preferences; MutableDict tracks the
+                # in-place update
+                if user.preferences is None:
+                    user.preferences = dict(preferences)
+                else:
+                    user.preferences.update(preferences)
                 user.updated_at = get_current_utc_time()
                 logger.info(f"Updated preferences for user: {user.email} (ID: {user_id})")
                 return True
@@ -506,43 +653,59 @@ class UserRepository(AdvancedRepository[User]):
     def get_users_with_no_recent_activity(
         self, 
         days: int = 30,
+        limit: Optional[int] = None,
+        batch_size: int = 500,
         session: Optional[Session] = None
-    ) -> List[User]:
+    ) -> Iterator[User]:
         """
-        Get users who haven't logged in recently.
+        Stream users who haven't logged in recently.
+        
+        Rows are fetched in batches of ``batch_size`` rather than loaded all at
+        once; callers that need a list should materialize it explicitly.
         
         Args:
             days: Number of days to consider as "recent"
+            limit: Maximum number of records to return
+            batch_size: Number of rows fetched per round trip
             session: Optional database session
             
         Returns:
-            List of inactive User instances
+            Iterator of inactive User instances
         """
-        def _get_inactive(session: Session) -> List[User]:
+        def _get_inactive(session: Session) -> Iterator[User]:
             cutoff_date = get_current_utc_time() - timedelta(days=days)
-            return session.query(User).filter(
+            query = session.query(User).filter(
                 or_(
                     User.last_login < cutoff_date,
                     User.last_login.is_(None)
                 )
-            ).filter(User.is_active == True).all()
+            ).filter(User.is_active == True).order_by(User.id)
+            
+            if limit:
+                query = query.limit(limit)
+            
+            return query.yield_per(batch_size)
         
         if session:
-            return _get_inactive(session)
+            yield from _get_inactive(session)
         else:
             from src.data_access.database.session import get_db_session
             with get_db_session() as session:
-                return _get_inactive(session)
+                yield from _get_inactive(session)
 
 
 # Global repository instance
 _user_repository: Optional[UserRepository] = None
+_user_repository_lock = threading.Lock()
 
 def get_user_repository() -> UserRepository:
     """Get the global user repository instance."""
     global _user_repository
     
     if _user_repository is None:
-        _user_repository = UserRepository()
+        # Double-checked so concurrent first calls build only one instance
+        with _user_repository_lock:
+            if _user_repository is None:
+                _user_repository = UserRepository()
     
     return _user_repository
@@ -1,27 +1,180 @@
 """Video repository for video-specific database operations."""
 
-from typing import List, Optional, Dict, Any, Tuple
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, desc, asc, func, text
+from typing import Callable, List, Optional, Dict, Any, Iterator, Tuple
+from sqlalchemy.orm import Session, Query, joinedload, contains_eager, selectinload, raiseload
+from sqlalchemy import and_, or_, desc, asc, func, text, update, exists, select, bindparam, tuple_
 from datetime import datetime, timedelta
+import inspect
 import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+from functools import wraps
 
 from ..base_repository import BaseRepository
-from ...models.video import Video
+from ...models.video import Video, search_vector_expression
 from ...models.channel import Channel
 from ...models.snapshot import Snapshot
 from ...models.tag import Tag, VideoTag
 
 logger = logging.getLogger(__name__)
 
+# Shortest query searched with full-text matching rather than substrings
+FULL_TEXT_MIN_QUERY_LENGTH = 3
+
+
+# Under test, lazy relationship loads from the listing queries raise so N+1
+# regressions fail loudly; elsewhere they fall back to default lazy loading
+STRICT_LOADING = os.getenv('FLASK_ENV', 'development') == 'testing'
+
+# Repository calls slower than this are logged as warnings
+SLOW_QUERY_THRESHOLD_MS = 500.0
+
+# Seconds a cached trending/stats result stays fresh
+RESULT_CACHE_TTL = 60.0
+RESULT_CACHE_MAX_ENTRIES = 256
+
+# Process-wide {key: (expires_at, value)}; values are plain data, never ORM
+# instances, since those are bound to the session that loaded them
+_result_cache: Dict[Tuple, Tuple[float, Any]] = {}
+_result_cache_lock = threading.Lock()
+
+
+def _get_cached_result(key: Tuple) -> Optional[Any]:
+    """Return a fresh cached value for key, or None."""
+    with _result_cache_lock:
+        entry = _result_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _set_cached_result(key: Tuple, value: Any) -> None:
+    """Cache value under key for RESULT_CACHE_TTL seconds."""
+    with _result_cache_lock:
+        if len(_result_cache) >= RESULT_CACHE_MAX_ENTRIES:
+            _result_cache.clear()
+        _result_cache[key] = (time.monotonic() + RESULT_CACHE_TTL, value)
+
+
+def clear_result_cache() -> None:
+    """Drop all cached trending and performance stats results."""
+    with _result_cache_lock:
+        _result_cache.clear()
+
+
+# Hot-path statements built once at import; executing the same statement
+# object with new parameters reuses SQLAlchemy's compiled form
+_VIDEO_BY_YOUTUBE_ID = select(Video).where(Video.video_id == bindparam('video_id'))
+
+_VIDEOS_BY_FORMAT = select(Video).where(
+    Video.is_short == bindparam('is_short'),
+    Video.is_deleted == False,
+    Video.view_count >= bindparam('min_views')
+).order_by(desc(Video.view_count))
+
+
+# Whether a _logged_query method is already running in this context; nested
+# decorated calls leave logging to the outermost one
+_in_logged_query: ContextVar[bool] = ContextVar('_in_logged_query', default=False)
+
+
+def _logged_query(action: str) -> Callable:
+    """Log failures and slow calls for a repository method.
+    
+    Only the outermost decorated call logs, so a method that calls another
+    decorated method reports one error and one slow-query warning. Generator
+    methods get failure logging only, since their elapsed time includes
+    however long the caller spends between rows.
+    
+    Args:
+        action: Description used in log messages, e.g. "getting Shorts videos"
+        
+    Returns:
+        Decorator wrapping the method
+    """
+    def decorator(func: Callable) -> Callable:
+        if inspect.isgeneratorfunction(func):
+            @wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                try:
+                    yield from func(*args, **kwargs)
+                except Exception as e:
+                    if not _in_logged_query.get():
+                        logger.error(f"Error {action}: {e}")
+                    raise
+            return generator_wrapper
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _in_logged_query.get():
+                return func(*args, **kwargs)
+            
+            token = _in_logged_query.set(True)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Error {action}: {e}")
+                raise
+            finally:
+                _in_logged_query.reset(token)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                if elapsed_ms > SLOW_QUERY_THRESHOLD_MS:
+                    logger.warning(f"Slow query {action}: {elapsed_ms:.0f} ms")
+        return wrapper
+    return decorator
+
+
+def _current_hour() -> datetime:
+    """Return utcnow truncated to the hour.
+    
+    Date-window cutoffs built from this stay identical for an hour, so repeated
+    calls send identical parameters to the plan and result caches.
+    """
+    return datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+
+
+def _has_tag(tag_criterion):
+    """Build an EXISTS clause matching videos with a tag satisfying tag_criterion."""
+    return exists().where(
+        VideoTag.video_id == Video.id,
+        VideoTag.tag_id == Tag.id,
+        tag_criterion
+    )
+
+
+def _video_search_vector():
+    """Build the tsvector expression backing ix_videos_search_tsv."""
+    return search_vector_expression(Video.title, Video.description)
+
 
 class VideoRepository(BaseRepository[Video]):
     """Repository for video-specific database operations."""
     
+    strict_loading = STRICT_LOADING
+    
     def __init__(self, session: Session):
         """Initialize video repository."""
         super().__init__(Video, session)
     
+    def _safe_query(self) -> Query:
+        """Start a Video query whose relationships must be loaded explicitly.
+        
+        In strict mode every relationship defaults to raiseload, so callers
+        that need video.channel or video.snapshots have to add a loader option
+        such as selectinload(Video.channel).
+        
+        Returns:
+            Query over Video
+        """
+        query = self.session.query(Video)
+        if self.strict_loading:
+            query = query.options(raiseload('*'))
+        return query
+    
+    @_logged_query("getting video by ID")
     def get_by_video_id(self, video_id: str) -> Optional[Video]:
         """Get video by YouTube video ID.
         
@@ -31,31 +184,52 @@ class VideoRepository(BaseRepository[Video]):
         Returns:
             Video instance or None if not found
         """
-        return self.find_one_by(video_id=video_id)
+        return self.session.scalars(
+            _VIDEO_BY_YOUTUBE_ID, {'video_id': video_id}
+        ).one_or_none()
     
+    @_logged_query("getting videos by channel")
     def get_videos_by_channel(self, channel_id: int, limit: Optional[int] = None, 
-                             include_deleted: bool = False) -> List[Video]:
-        """Get videos by channel ID.
+                             include_deleted: bool = False,
+                             before_published_at: Optional[datetime] = None,
+                             before_id: Optional[int] = None) -> List[Video]:
+        """Get videos by channel ID, newest first.
+        
+        Pages are fetched by keyset: pass the published_at and id of the last
+        video of the previous page as before_published_at and before_id
+        instead of an offset. Videos are ordered by (published_at, id), so
+        videos sharing the boundary timestamp are not skipped.
         
         Args:
             channel_id: Channel database ID
             limit: Maximum number of videos to return
             include_deleted: Whether to include deleted videos
+            before_published_at: Only return videos published before this time
+            before_id: With before_published_at, also return videos published at
+                exactly that time whose id is below this one
             
         Returns:
             List of video instances
         """
-        filters = {'channel_id': channel_id}
+        query = self.session.query(Video).filter(Video.channel_id == channel_id)
+        
         if not include_deleted:
-            filters['is_deleted'] = False
+            query = query.filter(Video.is_deleted == False)
+        if before_published_at is not None:
+            if before_id is not None:
+                query = query.filter(
+                    tuple_(Video.published_at, Video.id) < tuple_(before_published_at, before_id)
+                )
+            else:
+                query = query.filter(Video.published_at < before_published_at)
         
-        return self.find_by(
-            limit=limit,
-            order_by='published_at',
-            desc_order=True,
-            **filters
-        )
+        query = query.order_by(desc(Video.published_at), desc(Video.id))
+        if limit:
+            query = query.limit(limit)
+        
+        return query.all()
     
+    @_logged_query("getting videos by channel YouTube ID")
     def get_videos_by_channel_youtube_id(self, channel_youtube_id: str, 
                                        limit: Optional[int] = None) -> List[Video]:
         """Get videos by channel YouTube ID.
@@ -67,20 +241,32 @@ class VideoRepository(BaseRepository[Video]):
         Returns:
             List of video instances
         """
-        try:
-            query = self.session.query(Video).join(Channel).filter(
-                Channel.channel_id == channel_youtube_id,
-                Video.is_deleted == False
-            ).order_by(desc(Video.published_at))
-            
-            if limit:
-                query = query.limit(limit)
-            
-            return query.all()
-        except Exception as e:
-            logger.error(f"Error getting videos by channel YouTube ID: {e}")
-            raise
+        query = self.session.query(Video).join(Video.channel).options(
+            contains_eager(Video.channel)
+        ).filter(
+            Channel.channel_id == channel_youtube_id,
+            Video.is_deleted == False
+        ).order_by(desc(Video.published_at))
+        
+        if limit:
+            query = query.limit(limit)
+        
+        return query.all()
+    
+    def _get_videos_by_format(self, is_short: bool, limit: Optional[int],
+                              min_views: int) -> List[Video]:
+        """Run the shared Shorts/long-form listing statement."""
+        stmt = _VIDEOS_BY_FORMAT
+        if self.strict_loading:
+            stmt = stmt.options(raiseload('*'))
+        if limit:
+            stmt = stmt.limit(limit)
+        
+        return self.session.scalars(
+            stmt, {'is_short': is_short, 'min_views': min_views}
+        ).all()
     
+    @_logged_query("getting Shorts videos")
     def get_shorts(self, limit: Optional[int] = None, min_views: int = 0) -> List[Video]:
         """Get YouTube Shorts videos.
         
@@ -91,26 +277,9 @@ class VideoRepository(BaseRepository[Video]):
         Returns:
             List of Shorts videos
         """
-        filters = {
-            'is_short': True,
-            'is_deleted': False
-        }
-        
-        try:
-            query = self.session.query(Video).filter(
-                Video.is_short == True,
-                Video.is_deleted == False,
-                Video.view_count >= min_views
-            ).order_by(desc(Video.view_count))
-            
-            if limit:
-                query = query.limit(limit)
-            
-            return query.all()
-        except Exception as e:
-            logger.error(f"Error getting Shorts videos: {e}")
-            raise
+        return self._get_videos_by_format(True, limit, min_views)
     
+    @_logged_query("getting long-form videos")
     def get_long_form_videos(self, limit: Optional[int] = None, min_views: int = 0) -> List[Video]:
         """Get long-form videos (not Shorts).
         
@@ -121,21 +290,9 @@ class VideoRepository(BaseRepository[Video]):
         Returns:
             List of long-form videos
         """
-        try:
-            query = self.session.query(Video).filter(
-                Video.is_short == False,
-                Video.is_deleted == False,
-                Video.view_count >= min_views
-            ).order_by(desc(Video.view_count))
-            
-            if limit:
-                query = query.limit(limit)
-            
-            return query.all()
-        except Exception as e:
-            logger.error(f"Error getting long-form videos: {e}")
-            raise
+        return self._get_videos_by_format(False, limit, min_views)
     
+    @_logged_query("getting videos by category")
     def get_videos_by_category(self, category_name: str, limit: Optional[int] = None) -> List[Video]:
         """Get videos by category.
         
@@ -154,9 +311,14 @@ class VideoRepository(BaseRepository[Video]):
             desc_order=True
         )
     
+    @_logged_query("getting trending videos")
     def get_trending_videos(self, days: int = 7, limit: int = 50) -> List[Video]:
         """Get trending videos based on recent performance.
         
+        The ranking is cached per process for RESULT_CACHE_TTL seconds. Writes
+        through this repository clear the cache, but changes made by other
+        processes or outside the repository can be up to that old.
+        
         Args:
             days: Number of days to look back
             limit: Maximum number of videos to return
@@ -164,20 +326,29 @@ class VideoRepository(BaseRepository[Video]):
         Returns:
             List of trending videos
         """
-        try:
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
-            
-            query = self.session.query(Video).filter(
-                Video.published_at >= cutoff_date,
-                Video.is_deleted == False,
-                Video.view_count > 0
-            ).order_by(desc(Video.view_count)).limit(limit)
-            
-            return query.all()
-        except Exception as e:
-            logger.error(f"Error getting trending videos: {e}")
-            raise
+        cache_key = ('trending', days, limit)
+        video_ids = _get_cached_result(cache_key)
+        if video_ids is not None:
+            if not video_ids:
+                return []
+            # Rehydrate the cached ranking through the primary key
+            return self._safe_query().filter(
+                Video.id.in_(video_ids)
+            ).order_by(desc(Video.view_count)).all()
+        
+        cutoff_date = _current_hour() - timedelta(days=days)
+        
+        query = self._safe_query().filter(
+            Video.published_at >= cutoff_date,
+            Video.is_deleted == False,
+            Video.view_count > 0
+        ).order_by(desc(Video.view_count)).limit(limit)
+        
+        videos = query.all()
+        _set_cached_result(cache_key, [video.id for video in videos])
+        return videos
     
+    @_logged_query("getting viral videos")
     def get_viral_videos(self, threshold_multiplier: float = 10.0, limit: int = 50) -> List[Video]:
         """Get viral videos based on performance relative to channel average.
         
@@ -188,51 +359,90 @@ class VideoRepository(BaseRepository[Video]):
         Returns:
             List of viral videos
         """
-        try:
-            query = self.session.query(Video).join(Channel).filter(
-                Video.view_count >= Channel.avg_views_per_video * threshold_multiplier,
-                Video.is_deleted == False,
-                Channel.avg_views_per_video > 0
-            ).order_by(desc(Video.view_count)).limit(limit)
-            
-            return query.all()
-        except Exception as e:
-            logger.error(f"Error getting viral videos: {e}")
-            raise
+        query = self.session.query(Video).join(Video.channel).options(
+            contains_eager(Video.channel)
+        ).filter(
+            Video.view_count >= Channel.avg_views_per_video * threshold_multiplier,
+            Video.is_deleted == False,
+            Channel.avg_views_per_video > 0
+        ).order_by(desc(Video.view_count)).limit(limit)
+        
+        return query.all()
+    
+    def _training_filters(self, is_short: Optional[bool], min_age_days: int,
+                          max_age_days: int) -> List[Any]:
+        """Build the filter criteria shared by the training queries."""
+        min_date = _current_hour() - timedelta(days=max_age_days)
+        max_date = _current_hour() - timedelta(days=min_age_days)
+        
+        filters = [
+            Video.published_at >= min_date,
+            Video.published_at < max_date,
+            Video.is_deleted == False,
+            Video.is_private == False,
+            Video.view_count > 0,
+            Video.data_quality_score >= 0.7  # Good data quality
+        ]
+        
+        if is_short is not None:
+            filters.append(Video.is_short == is_short)
+        
+        return filters
     
+    @_logged_query("streaming videos for training")
     def get_videos_for_training(self, is_short: Optional[bool] = None, 
-                              min_age_days: int = 7, max_age_days: int = 365) -> List[Video]:
-        """Get videos suitable for model training.
+                              min_age_days: int = 7, max_age_days: int = 365,
+                              batch_size: int = 1000) -> Iterator[Video]:
+        """Stream videos suitable for model training.
         
         Args:
             is_short: Filter by video type (True for Shorts, False for long-form, None for all)
             min_age_days: Minimum age in days
             max_age_days: Maximum age in days
+            batch_size: Number of rows fetched per round trip
             
         Returns:
-            List of videos suitable for training
+            Lazy iterator of videos suitable for training; SQL runs, and
+            errors surface, when it is iterated
         """
-        try:
-            min_date = datetime.utcnow() - timedelta(days=max_age_days)
-            max_date = datetime.utcnow() - timedelta(days=min_age_days)
-            
-            query = self.session.query(Video).filter(
-                Video.published_at >= min_date,
-                Video.published_at <= max_date,
-                Video.is_deleted == False,
-                Video.is_private == False,
-                Video.view_count > 0,
-                Video.data_quality_score >= 0.7  # Good data quality
-            )
-            
-            if is_short is not None:
-                query = query.filter(Video.is_short == is_short)
+        query = self.session.query(Video).filter(
+            *self._training_filters(is_short, min_age_days, max_age_days)
+        ).order_by(desc(Video.published_at))
+        
+        yield from query.yield_per(batch_size)
+    
+    @_logged_query("streaming training rows")
+    def iter_training_rows(self, is_short: Optional[bool] = None,
+                           min_age_days: int = 7, max_age_days: int = 365,
+                           batch_size: int = 5000) -> Iterator[Tuple]:
+        """Stream the training columns as row tuples, without building Video instances.
+        
+        Args:
+            is_short: Filter by video type (True for Shorts, False for long-form, None for all)
+            min_age_days: Minimum age in days
+            max_age_days: Maximum age in days
+            batch_size: Number of rows fetched per round trip
             
-            return query.order_by(desc(Video.published_at)).all()
-        except Exception as e:
-            logger.error(f"Error getting videos for training: {e}")
-            raise
+        Returns:
+            Lazy iterator of (id, video_id, view_count, published_at,
+            duration_seconds, is_short, category_name) rows; like
+            get_videos_for_training, SQL runs when it is iterated
+        """
+        query = self.session.query(
+            Video.id,
+            Video.video_id,
+            Video.view_count,
+            Video.published_at,
+            Video.duration_seconds,
+            Video.is_short,
+            Video.category_name
+        ).filter(
+            *self._training_filters(is_short, min_age_days, max_age_days)
+        ).order_by(desc(Video.published_at))
+        
+        yield from query.yield_per(batch_size)
     
+    @_logged_query("getting videos needing tracking")
     def get_videos_needing_tracking(self, max_age_days: int = 30) -> List[Video]:
         """Get videos that need performance tracking.
         
@@ -242,24 +452,25 @@ class VideoRepository(BaseRepository[Video]):
         Returns:
             List of videos needing tracking
         """
-        try:
-            cutoff_date = datetime.utcnow() - timedelta(days=max_age_days)
-            
-            query = self.session.query(Video).filter(
-                Video.published_at >= cutoff_date,
-                Video.is_tracking_complete == False,
-                Video.is_deleted == False,
-                Video.is_private == False
-            ).order_by(asc(Video.published_at))
-            
-            return query.all()
-        except Exception as e:
-            logger.error(f"Error getting videos needing tracking: {e}")
-            raise
+        cutoff_date = datetime.utcnow() - timedelta(days=max_age_days)
+        
+        query = self._safe_query().filter(
+            Video.published_at >= cutoff_date,
+            Video.is_tracking_complete == False,
+            Video.is_deleted == False,
+            Video.is_private == False
+        ).order_by(asc(Video.published_at))
+        
+        return query.all()
     
+    @_logged_query("searching videos")
     def search_videos(self, query: str, limit: int = 50) -> List[Video]:
         """Search videos by title and description.
         
+        On PostgreSQL, queries of FULL_TEXT_MIN_QUERY_LENGTH characters or more
+        use the full-text expression index; shorter queries and other backends
+        use substring matching, which the trigram indexes serve on PostgreSQL.
+        
         Args:
             query: Search query
             limit: Maximum number of results
@@ -267,20 +478,23 @@ class VideoRepository(BaseRepository[Video]):
         Returns:
             List of matching videos
         """
-        try:
+        dialect = self.session.get_bind().dialect.name
+        if dialect == 'postgresql' and len(query.strip()) >= FULL_TEXT_MIN_QUERY_LENGTH:
+            search_filter = _video_search_vector().op('@@')(
+                func.plainto_tsquery('english', query)
+            )
+        else:
             search_filter = or_(
                 Video.title.ilike(f'%{query}%'),
                 Video.description.ilike(f'%{query}%')
             )
-            
-            return self.session.query(Video).filter(
-                search_filter,
-                Video.is_deleted == False
-            ).order_by(desc(Video.view_count)).limit(limit).all()
-        except Exception as e:
-            logger.error(f"Error searching videos: {e}")
-            raise
+        
+        return self.session.query(Video).filter(
+            search_filter,
+            Video.is_deleted == False
+        ).order_by(desc(Video.view_count)).limit(limit).all()
     
+    @_logged_query("getting videos with tags")
     def get_videos_with_tags(self, tag_names: List[str], match_all: bool = False) -> List[Video]:
         """Get videos that have specific tags.
         
@@ -291,27 +505,36 @@ class VideoRepository(BaseRepository[Video]):
         Returns:
             List of videos with the specified tags
         """
-        try:
-            query = self.session.query(Video).join(VideoTag).join(Tag).filter(
-                Tag.normalized_name.in_([name.lower().strip() for name in tag_names]),
+        normalized = list(dict.fromkeys(name.lower().strip() for name in tag_names))
+        if not normalized:
+            return []
+        
+        if match_all:
+            # One EXISTS per tag lets the planner probe the tag index for
+            # each predicate instead of aggregating the full join
+            query = self.session.query(Video).filter(
+                *[_has_tag(Tag.normalized_name == name) for name in normalized],
                 Video.is_deleted == False
             )
-            
-            if match_all:
-                # Video must have all specified tags
-                query = query.group_by(Video.id).having(
-                    func.count(Tag.id) == len(tag_names)
-                )
-            
-            return query.order_by(desc(Video.view_count)).all()
-        except Exception as e:
-            logger.error(f"Error getting videos with tags: {e}")
-            raise
+        else:
+            # EXISTS rather than a join so a video carrying several of the
+            # tags is returned once
+            query = self.session.query(Video).filter(
+                _has_tag(Tag.normalized_name.in_(normalized)),
+                Video.is_deleted == False
+            )
+        
+        return query.order_by(desc(Video.view_count)).all()
     
+    @_logged_query("getting performance stats")
     def get_performance_stats(self, channel_id: Optional[int] = None, 
                             days: int = 30) -> Dict[str, Any]:
         """Get performance statistics for videos.
         
+        Results are cached per process for RESULT_CACHE_TTL seconds. Writes
+        through this repository clear the cache, but changes made by other
+        processes or outside the repository can be up to that old.
+        
         Args:
             channel_id: Optional channel ID to filter by
             days: Number of days to analyze
@@ -319,46 +542,58 @@ class VideoRepository(BaseRepository[Video]):
         Returns:
             Dictionary with performance statistics
         """
-        try:
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
-            
-            query = self.session.query(Video).filter(
-                Video.published_at >= cutoff_date,
-                Video.is_deleted == False
-            )
-            
-            if channel_id:
-                query = query.filter(Video.channel_id == channel_id)
-            
-            videos = query.all()
-            
-            if not videos:
-                return {
-                    'total_videos': 0,
-                    'total_views': 0,
-                    'avg_views': 0,
-                    'avg_engagement_rate': 0,
-                    'shorts_count': 0,
-                    'longform_count': 0
-                }
-            
-            total_views = sum(v.view_count or 0 for v in videos)
-            total_engagement = sum(v.engagement_rate or 0 for v in videos)
-            shorts_count = sum(1 for v in videos if v.is_short)
-            
-            return {
-                'total_videos': len(videos),
+        cache_key = ('performance_stats', channel_id, days)
+        stats = _get_cached_result(cache_key)
+        if stats is not None:
+            return dict(stats)
+        
+        cutoff_date = _current_hour() - timedelta(days=days)
+        
+        # Aggregate in the database so a single row comes back instead of
+        # every video in the period
+        query = self.session.query(
+            func.count(Video.id),
+            func.coalesce(func.sum(Video.view_count), 0),
+            func.coalesce(func.sum(Video.engagement_rate), 0),
+            func.count().filter(Video.is_short == True),
+            func.count().filter(Video.is_short == False)
+        ).filter(
+            Video.published_at >= cutoff_date,
+            Video.is_deleted == False
+        )
+        
+        if channel_id:
+            query = query.filter(Video.channel_id == channel_id)
+        
+        total_videos, total_views, total_engagement, shorts_count, longform_count = query.one()
+        # SUM over BigInteger/Float comes back as Decimal on PostgreSQL
+        total_views = int(total_views)
+        total_engagement = float(total_engagement)
+        
+        if not total_videos:
+            stats = {
+                'total_videos': 0,
+                'total_views': 0,
+                'avg_views': 0,
+                'avg_engagement_rate': 0,
+                'shorts_count': 0,
+                'longform_count': 0
+            }
+        else:
+            stats = {
+                'total_videos': total_videos,
                 'total_views': total_views,
-                'avg_views': total_views / len(videos),
-                'avg_engagement_rate': total_engagement / len(videos),
+                'avg_views': total_views / total_videos,
+                'avg_engagement_rate': total_engagement / total_videos,
                 'shorts_count': shorts_count,
-                'longform_count': len(videos) - shorts_count,
+                'longform_count': longform_count,
                 'period_days': days
             }
-        except Exception as e:
-            logger.error(f"Error getting performance stats: {e}")
-            raise
+        
+        _set_cached_result(cache_key, stats)
+        return dict(stats)
     
+    @_logged_query("updating video statistics")
     def update_video_statistics(self, video_id: str, view_count: int, 
                               like_count: Optional[int] = None, 
                               comment_count: Optional[int] = None) -> Optional[Video]:
@@ -373,19 +608,50 @@ class VideoRepository(BaseRepository[Video]):
         Returns:
             Updated video instance or None if not found
         """
-        try:
-            video = self.get_by_video_id(video_id)
-            if not video:
-                return None
+        video = self.get_by_video_id(video_id)
+        if not video:
+            return None
+        
+        video.update_statistics(view_count, like_count, comment_count)
+        self.session.flush()
+        clear_result_cache()
+        
+        return video
+    
+    @_logged_query("bulk updating video statistics")
+    def bulk_update_video_statistics(self, rows: List[Tuple[str, int, Optional[int], Optional[int]]],
+                                     batch_size: int = 1000) -> int:
+        """Update statistics for many videos with batched loads and one flush.
+        
+        Videos are fetched with one IN query per batch instead of a lookup per
+        ID, and the unit of work sends the changes as executemany UPDATEs.
+        
+        Args:
+            rows: (video_id, view_count, like_count, comment_count) tuples
+            batch_size: Number of videos loaded per IN query
             
-            video.update_statistics(view_count, like_count, comment_count)
-            self.session.flush()
+        Returns:
+            Number of videos updated
+        """
+        stats_by_id = {row[0]: row[1:] for row in rows}
+        video_ids = list(stats_by_id)
+        updated_count = 0
+        
+        for start in range(0, len(video_ids), batch_size):
+            videos = self.session.query(Video).filter(
+                Video.video_id.in_(video_ids[start:start + batch_size])
+            ).all()
             
-            return video
-        except Exception as e:
-            logger.error(f"Error updating video statistics: {e}")
-            raise
+            for video in videos:
+                video.update_statistics(*stats_by_id[video.video_id])
+            updated_count += len(videos)
+        
+        self.session.flush()
+        clear_result_cache()
+        
+        return updated_count
     
+    @_logged_query("marking video as deleted")
     def mark_as_deleted(self, video_id: str) -> bool:
         """Mark a video as deleted.
         
@@ -395,20 +661,39 @@ class VideoRepository(BaseRepository[Video]):
         Returns:
             True if marked as deleted, False if not found
         """
-        try:
-            video = self.get_by_video_id(video_id)
-            if not video:
-                return False
-            
-            video.is_deleted = True
-            video.updated_at = datetime.utcnow()
-            self.session.flush()
+        video = self.get_by_video_id(video_id)
+        if not video:
+            return False
+        
+        # updated_at is set by the column's onupdate default
+        video.is_deleted = True
+        self.session.flush()
+        clear_result_cache()
+        
+        return True
+    
+    @_logged_query("marking videos as deleted")
+    def mark_many_as_deleted(self, video_ids: List[str]) -> int:
+        """Mark several videos as deleted with a single UPDATE.
+        
+        Args:
+            video_ids: YouTube video IDs
             
-            return True
-        except Exception as e:
-            logger.error(f"Error marking video as deleted: {e}")
-            raise
+        Returns:
+            Number of videos marked as deleted
+        """
+        if not video_ids:
+            return 0
+        
+        updated_count = self.session.query(Video).filter(
+            Video.video_id.in_(set(video_ids)),
+            Video.is_deleted == False
+        ).update({Video.is_deleted: True}, synchronize_session=False)
+        clear_result_cache()
+        
+        return updated_count
     
+    @_logged_query("getting videos with snapshots")
     def get_videos_with_snapshots(self, limit: Optional[int] = None) -> List[Video]:
         """Get videos that have snapshot data.
         
@@ -418,39 +703,58 @@ class VideoRepository(BaseRepository[Video]):
         Returns:
             List of videos with snapshot data
         """
-        try:
-            query = self.session.query(Video).join(Snapshot).filter(
-                Video.is_deleted == False
-            ).distinct().order_by(desc(Video.published_at))
-            
-            if limit:
-                query = query.limit(limit)
-            
-            return query.all()
-        except Exception as e:
-            logger.error(f"Error getting videos with snapshots: {e}")
-            raise
+        # EXISTS needs no de-duplication of the snapshot rows; snapshots
+        # themselves are loaded in one extra SELECT
+        query = self.session.query(Video).options(
+            selectinload(Video.snapshots)
+        ).filter(
+            Video.is_deleted == False,
+            Video.snapshots.any()
+        ).order_by(desc(Video.published_at))
+        
+        if limit:
+            query = query.limit(limit)
+        
+        return query.all()
     
-    def bulk_update_quality_scores(self) -> int:
+    @_logged_query("updating quality scores")
+    def bulk_update_quality_scores(self, batch_size: int = 2000) -> int:
         """Update data quality scores for all videos.
         
+        Scores are computed from column rows streamed in batches and written
+        back with one executemany UPDATE per batch, so no Video instances are
+        loaded.
+        
+        Args:
+            batch_size: Number of rows fetched and updated per batch
+            
         Returns:
             Number of videos updated
         """
-        try:
-            videos = self.find_by(is_deleted=False)
-            updated_count = 0
-            
-            for video in videos:
-                old_score = video.data_quality_score
-                new_score = video.calculate_data_quality_score()
-                
-                if old_score != new_score:
-                    updated_count += 1
-            
-            self.session.flush()
-            logger.info(f"Updated quality scores for {updated_count} videos")
-            return updated_count
-        except Exception as e:
-            logger.error(f"Error updating quality scores: {e}")
-            raise
+        columns = [getattr(Video, field) for field in Video.QUALITY_SCORE_FIELDS]
+        rows = self.session.query(
+            Video.id, Video.data_quality_score, *columns
+        ).filter(Video.is_deleted == False).yield_per(batch_size)
+        
+        now = datetime.utcnow()
+        updated_count = 0
+        batch = []
+        
+        for row in rows:
+            new_score = Video.score_data_quality(row, now)
+            if row.data_quality_score != new_score:
+                batch.append({'id': row.id, 'data_quality_score': new_score})
+            
+            if len(batch) >= batch_size:
+                self.session.execute(update(Video), batch)
+                updated_count += len(batch)
+                batch = []
+        
+        if batch:
+            self.session.execute(update(Video), batch)
+            updated_count += len(batch)
+        
+        clear_result_cache()
+        
+        logger.info(f"Updated quality scores for {updated_count} videos")
+        return updated_count
@@ -12,117 +12,96 @@ Features:
 - Pydantic models for type safety and validation
 """
 
-from .client import YouTubeAPIClient, YouTubeAPIClientSync
-from .exceptions import (
-    YouTubeAPIError,
-    QuotaExceededError,
-    AuthenticationError,
-    VideoNotFoundError,
-    ChannelNotFoundError,
-    RateLimitError,
-    InvalidRequestError,
-    NetworkError,
-    parse_youtube_api_error,
-    is_retryable_error,
-    get_retry_delay
-)
-from .quota_manager import QuotaManager, QuotaMonitor, APIEndpoint, APIKeyInfo
-from .models import (
-    # Video models
-    VideoResponse,
-    VideoSnippet,
-    VideoStatistics,
-    VideoContentDetails,
-    VideoThumbnail,
-    VideoThumbnails,
-    
-    # Channel models
-    ChannelResponse,
-    ChannelSnippet,
-    ChannelStatistics,
-    ChannelContentDetails,
-    
-    # Search models
-    SearchResponse,
-    SearchResult,
-    SearchResultSnippet,
-    SearchResultId,
-    
-    # Playlist models
-    PlaylistItemsResponse,
-    PlaylistItem,
-    PlaylistItemSnippet,
-    
-    # Batch response models
-    BatchVideoResponse,
-    BatchChannelResponse,
-    
-    # Utility functions
-    extract_video_id_from_url,
-    extract_channel_id_from_url,
-    validate_video_id,
-    validate_channel_id
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import YouTubeAPIClient, YouTubeAPIClientSync
 
-__all__ = [
+# Public names mapped to the submodule defining them. Submodules are imported
+# on first attribute access (PEP 562), so e.g. the URL helpers can be used
+# without loading the HTTP client or the quota manager.
+_LAZY_ATTRS = {
     # Client classes
-    'YouTubeAPIClient',
-    'YouTubeAPIClientSync',
+    'YouTubeAPIClient': 'client',
+    'YouTubeAPIClientSync': 'client',
     
     # Exception classes
-    'YouTubeAPIError',
-    'QuotaExceededError',
-    'AuthenticationError',
-    'VideoNotFoundError',
-    'ChannelNotFoundError',
-    'RateLimitError',
-    'InvalidRequestError',
-    'NetworkError',
-    'parse_youtube_api_error',
-    'is_retryable_error',
-    'get_retry_delay',
+    'YouTubeAPIError': 'exceptions',
+    'QuotaExceededError': 'exceptions',
+    'AuthenticationError': 'exceptions',
+    'VideoNotFoundError': 'exceptions',
+    'ChannelNotFoundError': 'exceptions',
+    'RateLimitError': 'exceptions',
+    'InvalidRequestError': 'exceptions',
+    'NetworkError': 'exceptions',
+    'ServerError': 'exceptions',
+    'ServiceUnavailableError': 'exceptions',
+    'parse_youtube_api_error': 'exceptions',
+    'is_retryable_error': 'exceptions',
+    'get_retry_delay': 'exceptions',
     
     # Quota management
-    'QuotaManager',
-    'QuotaMonitor',
-    'APIEndpoint',
-    'APIKeyInfo',
+    'QuotaManager': 'quota_manager',
+    'QuotaMonitor': 'quota_manager',
+    'APIEndpoint': 'quota_manager',
+    'APIKeyInfo': 'quota_manager',
     
     # Video models
-    'VideoResponse',
-    'VideoSnippet',
-    'VideoStatistics',
-    'VideoContentDetails',
-    'VideoThumbnail',
-    'VideoThumbnails',
+    'VideoResponse': 'models',
+    'VideoSnippet': 'models',
+    'VideoStatistics': 'models',
+    'VideoContentDetails': 'models',
+    'VideoThumbnail': 'models',
+    'VideoThumbnails': 'models',
     
     # Channel models
-    'ChannelResponse',
-    'ChannelSnippet',
-    'ChannelStatistics',
-    'ChannelContentDetails',
+    'ChannelResponse': 'models',
+    'ChannelSnippet': 'models',
+    'ChannelStatistics': 'models',
+    'ChannelContentDetails': 'models',
     
     # Search models
-    'SearchResponse',
-    'SearchResult',
-    'SearchResultSnippet',
-    'SearchResultId',
+    'SearchResponse': 'models',
+    'SearchResult': 'models',
+    'SearchResultSnippet': 'models',
+    'SearchResultId': 'models',
     
     # Playlist models
-    'PlaylistItemsResponse',
-    'PlaylistItem',
-    'PlaylistItemSnippet',
+    'PlaylistItemsResponse': 'models',
+    'PlaylistItem': 'models',
+    'PlaylistItemSnippet': 'models',
     
     # Batch response models
-    'BatchVideoResponse',
-    'BatchChannelResponse',
+    'BatchVideoResponse': 'models',
+    'BatchChannelResponse': 'models',
     
     # Utility functions
-    'extract_video_id_from_url',
-    'extract_channel_id_from_url',
-    'validate_video_id',
-    'validate_channel_id'
-]
+    'extract_video_id_from_url': 'models',
+    'extract_channel_id_from_url': 'models',
+    'validate_video_id': 'models',
+    'validate_channel_id': 'models',
+}
+
+
+def __getattr__(name: str):
+    """Import public names from their submodule on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily loaded names in dir()."""
+    return sorted(set(globals()) | set(__all__))
+
+# Every lazily loaded name is public; the create_* helpers are added below
+__all__ = list(_LAZY_ATTRS)
 
 __version__ = "1.0.0"
 __author__ = "ViewTrendsSL Team"
@@ -130,6 +109,7 @@ __description__ = "Enhanced YouTube API client for Sri Lankan content analysis"
 
 # Package-level configuration
 import logging
+import threading
 
 # Set up logging for the package
 logger = logging.getLogger(__name__)
@@ -140,9 +120,28 @@ DEFAULT_TIMEOUT = 30
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_QUOTA_STORAGE_PATH = "data/quota_usage.json"
 
-def create_client(api_keys: dict, **kwargs) -> YouTubeAPIClient:
+# Sync clients handed out by create_sync_client, keyed by configuration
+_client_cache: dict = {}
+_client_cache_lock = threading.Lock()
+
+
+def _client_config(api_keys: dict, kwargs: dict) -> tuple:
+    """Build the (cache key, constructor arguments) pair for a client config."""
+    config = (
+        kwargs.get('quota_storage_path', DEFAULT_QUOTA_STORAGE_PATH),
+        kwargs.get('timeout', DEFAULT_TIMEOUT),
+        kwargs.get('max_retries', DEFAULT_MAX_RETRIES)
+    )
+    return (frozenset(api_keys.items()),) + config, config
+
+
+def create_client(api_keys: dict, **kwargs) -> 'YouTubeAPIClient':
     """Create a YouTube API client with default configuration.
     
+    Every call builds a new client, since its connection pool is bound to
+    the event loop that first uses it. To share one client within a loop,
+    use ``YouTubeAPIClient.get_or_create``.
+    
     Args:
         api_keys: Dictionary of {key_name: api_key}
         **kwargs: Additional client configuration
@@ -150,16 +149,17 @@ def create_client(api_keys: dict, **kwargs) -> YouTubeAPIClient:
     Returns:
         Configured YouTubeAPIClient instance
     """
-    return YouTubeAPIClient(
-        api_keys=api_keys,
-        quota_storage_path=kwargs.get('quota_storage_path', DEFAULT_QUOTA_STORAGE_PATH),
-        timeout=kwargs.get('timeout', DEFAULT_TIMEOUT),
-        max_retries=kwargs.get('max_retries', DEFAULT_MAX_RETRIES)
-    )
+    from .client import YouTubeAPIClient
+    
+    _, config = _client_config(api_keys, kwargs)
+    return YouTubeAPIClient(api_keys, *config)
+
 
-def create_sync_client(api_keys: dict, **kwargs) -> YouTubeAPIClientSync:
+def create_sync_client(api_keys: dict, **kwargs) -> 'YouTubeAPIClientSync':
     """Create a synchronous YouTube API client with default configuration.
     
+    Calls with the same keys and configuration share one client.
+    
     Args:
         api_keys: Dictionary of {key_name: api_key}
         **kwargs: Additional client configuration
@@ -167,12 +167,29 @@ def create_sync_client(api_keys: dict, **kwargs) -> YouTubeAPIClientSync:
     Returns:
         Configured YouTubeAPIClientSync instance
     """
-    return YouTubeAPIClientSync(
-        api_keys=api_keys,
-        quota_storage_path=kwargs.get('quota_storage_path', DEFAULT_QUOTA_STORAGE_PATH),
-        timeout=kwargs.get('timeout', DEFAULT_TIMEOUT),
-        max_retries=kwargs.get('max_retries', DEFAULT_MAX_RETRIES)
-    )
+    from .client import YouTubeAPIClientSync
+    
+    key, config = _client_config(api_keys, kwargs)
+    key = ('sync',) + key
+    with _client_cache_lock:
+        client = _client_cache.get(key)
+        if client is None:
+            client = YouTubeAPIClientSync(api_keys, *config)
+            _client_cache[key] = client
+        return client
+
+
+def clear_client_cache() -> None:
+    """Forget all shared clients.
+    
+    Later create_sync_client and YouTubeAPIClient.get_or_create calls build
+    new ones.
+    """
+    from .client import YouTubeAPIClient
+    
+    with _client_cache_lock:
+        _client_cache.clear()
+    YouTubeAPIClient.clear_shared_instances()
 
 # Add convenience functions to __all__
-__all__.extend(['create_client', 'create_sync_client'])
+__all__.extend(['create_client', 'create_sync_client', 'clear_client_cache'])
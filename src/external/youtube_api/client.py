@@ -1,21 +1,26 @@
 """Main YouTube API client for ViewTrendsSL."""
 
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Union, Any, Tuple
 import asyncio
+import atexit
+import random
+import threading
 import time
 import logging
+from collections import OrderedDict
 from datetime import datetime, timezone
 import httpx
+import orjson
 from urllib.parse import urlencode
 
 from .exceptions import (
     YouTubeAPIError, QuotaExceededError, AuthenticationError,
     RateLimitError, NetworkError, parse_youtube_api_error,
-    is_retryable_error, get_retry_delay
+    is_retryable_error
 )
 from .models import (
     VideoResponse, ChannelResponse, SearchResponse,
-    BatchVideoResponse, BatchChannelResponse, PlaylistItemsResponse,
+    BatchVideoResponse, BatchChannelResponse,
     extract_video_id_from_url, extract_channel_id_from_url,
     validate_video_id, validate_channel_id
 )
@@ -23,12 +28,106 @@ from .quota_manager import QuotaManager, APIEndpoint
 
 logger = logging.getLogger(__name__)
 
+try:
+    import h2  # noqa: F401 -- httpx needs it to negotiate HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401 -- httpx needs it to decode br responses
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Keywords combined with the caller's query when discovering Sri Lankan channels
+SRI_LANKAN_SEARCH_KEYWORDS = (
+    "sri lanka", "srilanka", "colombo", "kandy", "galle",
+    "sinhala", "tamil", "ceylon", "lanka"
+)
+
+
+def _decode_response(content: bytes, response_type: Optional[type]) -> Any:
+    """Decode a JSON body and validate it into ``response_type`` if given."""
+    data = orjson.loads(content)
+    if response_type is None:
+        return data
+    return response_type.model_validate(data)
+
+
+def _normalize_video_id(value: str) -> Optional[str]:
+    """Return a bare video ID for an ID or URL, or None if it is invalid."""
+    if validate_video_id(value):
+        return value
+    extracted_id = extract_video_id_from_url(value)
+    if not extracted_id:
+        logger.warning(f"Invalid video ID skipped: {value}")
+    return extracted_id
+
+
+def _normalize_channel_id(value: str) -> Optional[str]:
+    """Return a bare channel ID for an ID or URL, or None if it is invalid."""
+    if validate_channel_id(value):
+        return value
+    extracted_id = extract_channel_id_from_url(value)
+    if not extracted_id:
+        logger.warning(f"Invalid channel ID skipped: {value}")
+    return extracted_id
+
 
 class YouTubeAPIClient:
     """Enhanced YouTube API client with quota management and retry logic."""
     
     BASE_URL = "https://www.googleapis.com/youtube/v3"
     
+    # IDs accepted per videos.list/channels.list call
+    MAX_IDS_PER_REQUEST = 50
+    # HTTP pool sizing; with HTTP/2 most requests share one multiplexed connection
+    MAX_CONNECTIONS = 128
+    MAX_KEEPALIVE_CONNECTIONS = 64
+    KEEPALIVE_EXPIRY = 60.0
+    CONNECT_TIMEOUT = 5.0
+    # Batch requests in flight at once for a single multi-ID lookup
+    MAX_CONCURRENT_BATCHES = 20
+    # Sent on every request; set once so HTTP/2 header compression can reuse them
+    DEFAULT_HEADERS = {
+        'Accept': 'application/json',
+        # Only advertise brotli when httpx can decode it
+        'Accept-Encoding': 'gzip, br' if BROTLI_AVAILABLE else 'gzip',
+    }
+    # Clients handed out by get_or_create, keyed by configuration
+    _instances: Dict[Tuple, 'YouTubeAPIClient'] = {}
+    _instances_lock = threading.Lock()
+    
+    # Bodies larger than this are decoded and validated in a worker thread
+    THREADED_PARSE_THRESHOLD = 32 * 1024
+    # Decorrelated-jitter retry backoff bounds (seconds)
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 300.0
+    
+    # Default partial-response mask for videos.list: everything the response
+    # models read (all thumbnail sizes included), without localizations etc.
+    VIDEO_FIELDS = (
+        'kind,etag,pageInfo,'
+        'items(kind,etag,id,'
+        'snippet(publishedAt,channelId,title,description,thumbnails,channelTitle,'
+        'tags,categoryId,liveBroadcastContent,defaultLanguage,defaultAudioLanguage),'
+        'statistics,'
+        'contentDetails(duration,dimension,definition,caption,licensedContent))'
+    )
+    # Parts VIDEO_FIELDS covers; requests for other parts go unmasked
+    VIDEO_FIELDS_PARTS = frozenset({'snippet', 'statistics', 'contentDetails'})
+    # Mask for paging an uploads playlist, where only video IDs and dates are read
+    PLAYLIST_ID_FIELDS = 'nextPageToken,items/snippet(publishedAt,resourceId/videoId)'
+    # Single-resource responses served from memory before revalidating (seconds)
+    RESPONSE_CACHE_TTL = 300.0
+    RESPONSE_CACHE_MAX_ENTRIES = 4096
+    
     def __init__(self, api_keys: Dict[str, str], quota_storage_path: Optional[str] = None,
                  timeout: int = 30, max_retries: int = 3):
         """Initialize YouTube API client.
@@ -44,11 +143,32 @@ class YouTubeAPIClient:
         self.max_retries = max_retries
         
         # HTTP client configuration
+        limits = httpx.Limits(
+            max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+            max_connections=self.MAX_CONNECTIONS,
+            keepalive_expiry=self.KEEPALIVE_EXPIRY
+        )
         self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(timeout),
-            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(timeout, connect=self.CONNECT_TIMEOUT),
+            headers=self.DEFAULT_HEADERS,
+            # Retries are handled by _make_request, not the transport
+            transport=httpx.AsyncHTTPTransport(retries=0, http2=HTTP2_AVAILABLE, limits=limits)
         )
         
+        # Set for instances shared through get_or_create
+        self._shared_key: Optional[Tuple] = None
+        self._refcount = 0
+        
+        # Parsed once here rather than from a formatted string on every request
+        self._endpoint_urls = {
+            endpoint: httpx.URL(f"{self.BASE_URL}/{endpoint.endpoint_name}")
+            for endpoint in APIEndpoint
+        }
+        
+        # (endpoint, id, parts, fields) -> (fetched_at, etag, item), in LRU order
+        self._response_cache: "OrderedDict[Tuple, Tuple[float, Optional[str], Any]]" = OrderedDict()
+        
         logger.info(f"Initialized YouTube API client with {len(api_keys)} API keys")
     
     async def __aenter__(self):
@@ -59,84 +179,179 @@ class YouTubeAPIClient:
         """Async context manager exit."""
         await self.close()
     
+    @classmethod
+    def get_or_create(cls, api_keys: Dict[str, str], quota_storage_path: Optional[str] = None,
+                      timeout: int = 30, max_retries: int = 3) -> 'YouTubeAPIClient':
+        """Get the shared client for a configuration, creating it if needed.
+        
+        Sharing one client keeps a single quota manager and lets keep-alive
+        connections be reused across call sites. Each call takes a reference
+        that ``close()`` releases; the HTTP pool is only closed when the last
+        holder closes. The pool is bound to the event loop that first uses
+        it, so share it within one loop only.
+        
+        Args:
+            api_keys: Dictionary of {key_name: api_key}
+            quota_storage_path: Path to store quota usage data
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries for failed requests
+            
+        Returns:
+            Shared YouTubeAPIClient instance
+        """
+        key = (frozenset(api_keys.items()), quota_storage_path, timeout, max_retries)
+        with cls._instances_lock:
+            client = cls._instances.get(key)
+            if client is None or client.client.is_closed:
+                client = cls(api_keys, quota_storage_path, timeout, max_retries)
+                client._shared_key = key
+                cls._instances[key] = client
+            client._refcount += 1
+            return client
+    
+    @classmethod
+    def clear_shared_instances(cls) -> None:
+        """Forget all shared clients so get_or_create builds new ones."""
+        with cls._instances_lock:
+            cls._instances.clear()
+    
     async def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP client and persist pending quota usage.
+        
+        For a shared client this only releases one reference until the last
+        holder closes it.
+        """
+        if self._shared_key is not None:
+            with self._instances_lock:
+                self._refcount -= 1
+                if self._refcount > 0:
+                    return
+                if self._instances.get(self._shared_key) is self:
+                    del self._instances[self._shared_key]
+        
         await self.client.aclose()
+        await asyncio.to_thread(self.quota_manager.close)
+    
+    def clear_response_cache(self) -> None:
+        """Drop all cached single-resource responses."""
+        self._response_cache.clear()
     
     async def _make_request(self, endpoint: APIEndpoint, params: Dict[str, Any],
-                          expected_response_type: type) -> Any:
+                          expected_response_type: Optional[type], etag: Optional[str] = None) -> Any:
         """Make a request to the YouTube API with retry logic.
         
         Args:
             endpoint: API endpoint to call
             params: Request parameters
-            expected_response_type: Expected response model type
+            expected_response_type: Expected response model type, or None to
+                return the decoded JSON dict without validation
+            etag: ETag of a previously fetched response; sent as If-None-Match
             
         Returns:
-            Parsed response object
+            Parsed response object, or None if ``etag`` was given and the
+            API answered 304 Not Modified
             
         Raises:
             YouTubeAPIError: If request fails after all retries
         """
+        # Resolve everything that is fixed for this call once, outside the retry loop
+        quota_manager = self.quota_manager
+        http_get = self.client.get
+        url = self._endpoint_urls[endpoint]
+        headers = {'If-None-Match': etag} if etag else None
+        log_attempts = logger.isEnabledFor(logging.DEBUG)
+        
         # Get the best API key for this request
-        key_info = self.quota_manager.get_best_key_for_request(endpoint)
+        key_info = quota_manager.get_best_key_for_request(endpoint)
         if not key_info:
             raise QuotaExceededError("No API keys with sufficient quota available")
         
         # Reserve quota
-        if not self.quota_manager.reserve_quota(key_info, endpoint):
+        if not quota_manager.reserve_quota(key_info, endpoint):
             raise QuotaExceededError(f"Failed to reserve quota for {endpoint.endpoint_name}")
         
-        # Add API key to parameters
-        params['key'] = key_info.key
-        
-        # Build URL
-        url = f"{self.BASE_URL}/{endpoint.endpoint_name}"
+        # Add API key to a copy so the caller's params are never modified
+        params = {**params, 'key': key_info.key}
         
         last_error = None
+        tried_keys = {key_info.name}
+        prev_delay = self.RETRY_BASE_DELAY
         
         for attempt in range(self.max_retries + 1):
             try:
-                logger.debug(f"Making request to {endpoint.endpoint_name} (attempt {attempt + 1})")
+                if log_attempts:
+                    logger.debug(f"Making request to {endpoint.endpoint_name} (attempt {attempt + 1})")
+                
+                response = await http_get(url, params=params, headers=headers)
                 
-                response = await self.client.get(url, params=params)
+                if response.status_code == 304:
+                    # Unchanged since the cached copy; nothing to parse
+                    quota_manager.record_request_success(key_info, endpoint)
+                    return None
                 
                 # Check for HTTP errors
                 if response.status_code == 200:
-                    # Success
-                    data = response.json()
-                    self.quota_manager.record_request_success(key_info, endpoint)
+                    # Success; parse large bodies off the loop so other
+                    # requests keep being dispatched meanwhile
+                    content = response.content
+                    if len(content) > self.THREADED_PARSE_THRESHOLD:
+                        result = await asyncio.to_thread(_decode_response, content, expected_response_type)
+                    else:
+                        result = _decode_response(content, expected_response_type)
                     
-                    # Parse and return response
-                    return expected_response_type.parse_obj(data)
+                    quota_manager.record_request_success(key_info, endpoint)
+                    return result
                 
                 else:
-                    # API error
-                    try:
-                        error_data = response.json()
-                    except:
-                        error_data = {'error': {'message': f'HTTP {response.status_code}'}}
+                    # API error; proxies and load balancers may answer with HTML
+                    content = response.content
+                    error_data = None
+                    if content.lstrip()[:1] == b'{':
+                        try:
+                            error_data = orjson.loads(content)
+                        except orjson.JSONDecodeError:
+                            pass
+                    if not isinstance(error_data, dict):
+                        error_data = {'error': {
+                            'message': f'HTTP {response.status_code}',
+                            'body': content[:256].decode(errors='replace')
+                        }}
                     
                     api_error = parse_youtube_api_error(error_data, response.status_code)
                     
                     # Record error
-                    self.quota_manager.record_request_error(key_info, endpoint, api_error)
+                    quota_manager.record_request_error(key_info, endpoint, api_error)
+                    
+                    if attempt == self.max_retries:
+                        raise api_error
+                    
+                    # A quota or rate limit on this key says nothing about the
+                    # others: hop to an untried key straight away
+                    if isinstance(api_error, (QuotaExceededError, RateLimitError)):
+                        next_key = self._reserve_other_key(endpoint, tried_keys)
+                        if next_key is not None:
+                            logger.warning(f"{api_error}; switching to API key {next_key.name}")
+                            key_info = next_key
+                            tried_keys.add(key_info.name)
+                            params['key'] = key_info.key
+                            last_error = api_error
+                            continue
                     
                     # Check if we should retry
-                    if not is_retryable_error(api_error) or attempt == self.max_retries:
+                    if not is_retryable_error(api_error):
                         raise api_error
                     
                     last_error = api_error
                     
                     # Wait before retry
-                    delay = get_retry_delay(api_error, attempt + 1)
-                    logger.warning(f"Request failed, retrying in {delay}s: {api_error}")
-                    await asyncio.sleep(delay)
+                    prev_delay = self._retry_delay(api_error, prev_delay)
+                    logger.warning(f"Request failed, retrying in {prev_delay:.1f}s: {api_error}")
+                    await asyncio.sleep(prev_delay)
             
             except httpx.RequestError as e:
                 # Network error
                 network_error = NetworkError(f"Network error: {str(e)}", original_error=e)
-                self.quota_manager.record_request_error(key_info, endpoint, network_error)
+                quota_manager.record_request_error(key_info, endpoint, network_error)
                 
                 if attempt == self.max_retries:
                     raise network_error
@@ -144,19 +359,160 @@ class YouTubeAPIClient:
                 last_error = network_error
                 
                 # Wait before retry
-                delay = get_retry_delay(network_error, attempt + 1)
-                logger.warning(f"Network error, retrying in {delay}s: {e}")
-                await asyncio.sleep(delay)
+                prev_delay = self._retry_delay(network_error, prev_delay)
+                logger.warning(f"Network error, retrying in {prev_delay:.1f}s: {e}")
+                await asyncio.sleep(prev_delay)
         
         # If we get here, all retries failed
         raise last_error or YouTubeAPIError("Request failed after all retries")
     
-    async def get_video(self, video_id: str, parts: List[str] = None) -> VideoResponse:
+    def _reserve_other_key(self, endpoint: APIEndpoint, tried_keys: set) -> Optional[Any]:
+        """Pick a key not yet tried for this request and reserve quota on it.
+        
+        Args:
+            endpoint: API endpoint being called
+            tried_keys: Names of keys already used for this request
+            
+        Returns:
+            Key info with quota reserved, or None if no other key is usable
+        """
+        key_info = self.quota_manager.get_best_key_for_request(endpoint, exclude=tried_keys)
+        if key_info is None or not self.quota_manager.reserve_quota(key_info, endpoint):
+            return None
+        return key_info
+    
+    def _retry_delay(self, error: Exception, prev_delay: float) -> float:
+        """Get the next retry delay using decorrelated jitter.
+        
+        Each delay is drawn from [base, 3 * previous delay] and capped, so
+        concurrent requests failing together spread out instead of retrying
+        in lockstep. An explicit retry-after from the API takes precedence.
+        
+        Args:
+            error: Exception that occurred
+            prev_delay: Delay used before the previous retry
+            
+        Returns:
+            Delay in seconds before retrying
+        """
+        retry_after = getattr(error, 'retry_after', None)
+        if retry_after:
+            return float(retry_after)
+        return min(self.RETRY_MAX_DELAY, random.uniform(self.RETRY_BASE_DELAY, prev_delay * 3))
+    
+    async def _get_cached_item(self, endpoint: APIEndpoint, resource_id: str,
+                               parts: List[str], response_type: type,
+                               fields: Optional[str] = None) -> Optional[Any]:
+        """Fetch a single resource by ID through the in-process response cache.
+        
+        Entries younger than ``RESPONSE_CACHE_TTL`` are served without a
+        request; older ones are revalidated with their ETag so an unchanged
+        resource costs neither a download nor a re-parse.
+        
+        Args:
+            endpoint: List endpoint accepting an ``id`` parameter
+            resource_id: Resource ID to fetch
+            parts: List of parts to retrieve
+            response_type: Batch response model type
+            fields: Optional partial-response mask
+            
+        Returns:
+            The resource item, or None if the API returned no item for the ID
+        """
+        cache_key = (endpoint, resource_id, tuple(parts), fields)
+        cached = self._response_cache.get(cache_key)
+        now = time.monotonic()
+        etag = None
+        
+        if cached is not None:
+            fetched_at, etag, item = cached
+            if now - fetched_at < self.RESPONSE_CACHE_TTL:
+                self._response_cache.move_to_end(cache_key)
+                return item
+        
+        params = {
+            'part': ','.join(parts),
+            'id': resource_id
+        }
+        if fields:
+            params['fields'] = fields
+        
+        response = await self._make_request(endpoint, params, response_type, etag=etag)
+        
+        if response is None:
+            # 304 Not Modified: keep serving the cached item
+            item = cached[2]
+        elif not response.items:
+            self._response_cache.pop(cache_key, None)
+            return None
+        else:
+            item = response.items[0]
+            etag = response.etag
+        
+        self._response_cache[cache_key] = (now, etag, item)
+        self._response_cache.move_to_end(cache_key)
+        while len(self._response_cache) > self.RESPONSE_CACHE_MAX_ENTRIES:
+            self._response_cache.popitem(last=False)
+        
+        return item
+    
+    async def _fetch_in_batches(self, endpoint: APIEndpoint, ids: List[str], parts: List[str],
+                                response_type: type, fields: Optional[str] = None) -> List[Any]:
+        """Fetch resources by ID in API-sized batches issued concurrently.
+        
+        Args:
+            endpoint: List endpoint accepting a comma-separated ``id`` parameter
+            ids: Resource IDs to fetch (duplicates are requested once)
+            parts: List of parts to retrieve
+            response_type: Batch response model type
+            fields: Optional partial-response mask
+            
+        Returns:
+            Items for the IDs that were found, in the order first requested
+        """
+        # Dedupe while keeping the caller's order so no quota goes on repeats
+        ids = list(dict.fromkeys(ids))
+        
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_BATCHES)
+        
+        async def _fetch(batch_ids: List[str]) -> Any:
+            params = {
+                'part': ','.join(parts),
+                'id': ','.join(batch_ids)
+            }
+            if fields:
+                params['fields'] = fields
+            async with semaphore:
+                return await self._make_request(endpoint, params, response_type)
+        
+        responses = await asyncio.gather(*(
+            _fetch(ids[i:i + self.MAX_IDS_PER_REQUEST])
+            for i in range(0, len(ids), self.MAX_IDS_PER_REQUEST)
+        ))
+        
+        items_by_id = {item.id: item for response in responses for item in response.items}
+        return [items_by_id[resource_id] for resource_id in ids if resource_id in items_by_id]
+    
+    def _default_video_fields(self, parts: List[str]) -> str:
+        """Pick the default partial-response mask for a videos.list request.
+        
+        VIDEO_FIELDS only lists the snippet, statistics and contentDetails
+        parts, so it would strip any other requested part from the response.
+        """
+        if self.VIDEO_FIELDS_PARTS.issuperset(parts):
+            return self.VIDEO_FIELDS
+        return ''
+    
+    async def get_video(self, video_id: str, parts: List[str] = None,
+                        fields: Optional[str] = None) -> VideoResponse:
         """Get information about a single video.
         
         Args:
             video_id: YouTube video ID
             parts: List of parts to retrieve (default: snippet, statistics, contentDetails)
+            fields: Partial-response mask (default: VIDEO_FIELDS when ``parts``
+                are all covered by it, else the full response; '' for the full
+                response)
             
         Returns:
             VideoResponse object
@@ -174,25 +530,29 @@ class YouTubeAPIClient:
         if parts is None:
             parts = ['snippet', 'statistics', 'contentDetails']
         
-        params = {
-            'part': ','.join(parts),
-            'id': video_id
-        }
+        if fields is None:
+            fields = self._default_video_fields(parts)
         
-        response = await self._make_request(APIEndpoint.VIDEOS_LIST, params, BatchVideoResponse)
+        item = await self._get_cached_item(
+            APIEndpoint.VIDEOS_LIST, video_id, parts, BatchVideoResponse, fields
+        )
         
-        if not response.items:
+        if item is None:
             from .exceptions import VideoNotFoundError
             raise VideoNotFoundError(video_id)
         
-        return response.items[0]
+        return item
     
-    async def get_videos(self, video_ids: List[str], parts: List[str] = None) -> List[VideoResponse]:
+    async def get_videos(self, video_ids: List[str], parts: List[str] = None,
+                         fields: Optional[str] = None) -> List[VideoResponse]:
         """Get information about multiple videos.
         
         Args:
             video_ids: List of YouTube video IDs
             parts: List of parts to retrieve
+            fields: Partial-response mask (default: VIDEO_FIELDS when ``parts``
+                are all covered by it, else the full response; '' for the full
+                response)
             
         Returns:
             List of VideoResponse objects
@@ -207,34 +567,17 @@ class YouTubeAPIClient:
             parts = ['snippet', 'statistics', 'contentDetails']
         
         # Validate and clean video IDs
-        clean_ids = []
-        for video_id in video_ids:
-            if validate_video_id(video_id):
-                clean_ids.append(video_id)
-            else:
-                extracted_id = extract_video_id_from_url(video_id)
-                if extracted_id:
-                    clean_ids.append(extracted_id)
-                else:
-                    logger.warning(f"Invalid video ID skipped: {video_id}")
+        clean_ids = [video_id for video_id in map(_normalize_video_id, video_ids) if video_id]
         
         if not clean_ids:
             return []
         
-        # Process in batches of 50 (API limit)
-        all_videos = []
-        for i in range(0, len(clean_ids), 50):
-            batch_ids = clean_ids[i:i+50]
-            
-            params = {
-                'part': ','.join(parts),
-                'id': ','.join(batch_ids)
-            }
-            
-            response = await self._make_request(APIEndpoint.VIDEOS_LIST, params, BatchVideoResponse)
-            all_videos.extend(response.items)
+        if fields is None:
+            fields = self._default_video_fields(parts)
         
-        return all_videos
+        return await self._fetch_in_batches(
+            APIEndpoint.VIDEOS_LIST, clean_ids, parts, BatchVideoResponse, fields
+        )
     
     async def get_channel(self, channel_id: str, parts: List[str] = None) -> ChannelResponse:
         """Get information about a single channel.
@@ -259,18 +602,13 @@ class YouTubeAPIClient:
         if parts is None:
             parts = ['snippet', 'statistics', 'contentDetails']
         
-        params = {
-            'part': ','.join(parts),
-            'id': channel_id
-        }
-        
-        response = await self._make_request(APIEndpoint.CHANNELS_LIST, params, BatchChannelResponse)
+        item = await self._get_cached_item(APIEndpoint.CHANNELS_LIST, channel_id, parts, BatchChannelResponse)
         
-        if not response.items:
+        if item is None:
             from .exceptions import ChannelNotFoundError
             raise ChannelNotFoundError(channel_id)
         
-        return response.items[0]
+        return item
     
     async def get_channels(self, channel_ids: List[str], parts: List[str] = None) -> List[ChannelResponse]:
         """Get information about multiple channels.
@@ -292,34 +630,14 @@ class YouTubeAPIClient:
             parts = ['snippet', 'statistics', 'contentDetails']
         
         # Validate and clean channel IDs
-        clean_ids = []
-        for channel_id in channel_ids:
-            if validate_channel_id(channel_id):
-                clean_ids.append(channel_id)
-            else:
-                extracted_id = extract_channel_id_from_url(channel_id)
-                if extracted_id:
-                    clean_ids.append(extracted_id)
-                else:
-                    logger.warning(f"Invalid channel ID skipped: {channel_id}")
+        clean_ids = [channel_id for channel_id in map(_normalize_channel_id, channel_ids) if channel_id]
         
         if not clean_ids:
             return []
         
-        # Process in batches of 50 (API limit)
-        all_channels = []
-        for i in range(0, len(clean_ids), 50):
-            batch_ids = clean_ids[i:i+50]
-            
-            params = {
-                'part': ','.join(parts),
-                'id': ','.join(batch_ids)
-            }
-            
-            response = await self._make_request(APIEndpoint.CHANNELS_LIST, params, BatchChannelResponse)
-            all_channels.extend(response.items)
-        
-        return all_channels
+        return await self._fetch_in_batches(
+            APIEndpoint.CHANNELS_LIST, clean_ids, parts, BatchChannelResponse
+        )
     
     async def search_videos(self, query: str, max_results: int = 50, 
                           published_after: Optional[datetime] = None,
@@ -383,38 +701,62 @@ class YouTubeAPIClient:
         
         uploads_playlist_id = channel.content_details.uploads_playlist_id
         
-        # Get video IDs from the playlist
-        video_ids = []
+        # publishedAt is RFC 3339 UTC, so the cutoff compares as a string
+        cutoff = None
+        if published_after:
+            if published_after.tzinfo is not None:
+                published_after = published_after.astimezone(timezone.utc)
+            cutoff = published_after.strftime('%Y-%m-%dT%H:%M:%S')
+        
+        # Page tokens are opaque, so pages are fetched one after another; each
+        # page's video details are requested while the next page is fetched
+        detail_tasks = []
+        collected = 0
         next_page_token = None
         
-        while len(video_ids) < max_results:
-            params = {
-                'part': 'snippet',
-                'playlistId': uploads_playlist_id,
-                'maxResults': min(50, max_results - len(video_ids))
-            }
-            
-            if next_page_token:
-                params['pageToken'] = next_page_token
-            
-            response = await self._make_request(APIEndpoint.PLAYLIST_ITEMS_LIST, params, PlaylistItemsResponse)
-            
-            for item in response.items:
-                if item.snippet.video_id:
+        try:
+            while collected < max_results:
+                params = {
+                    'part': 'snippet',
+                    'playlistId': uploads_playlist_id,
+                    'maxResults': min(50, max_results - collected),
+                    'fields': self.PLAYLIST_ID_FIELDS
+                }
+                
+                if next_page_token:
+                    params['pageToken'] = next_page_token
+                
+                # Only IDs are needed here, so skip model validation
+                data = await self._make_request(APIEndpoint.PLAYLIST_ITEMS_LIST, params, None)
+                
+                page_ids = []
+                for item in data.get('items', ()):
+                    snippet = item.get('snippet', {})
+                    video_id = snippet.get('resourceId', {}).get('videoId')
+                    if not video_id:
+                        continue
                     # Check published date filter
-                    if published_after and item.snippet.published_at < published_after:
+                    if cutoff and snippet.get('publishedAt', '')[:19] < cutoff:
                         continue
-                    video_ids.append(item.snippet.video_id)
+                    page_ids.append(video_id)
+                
+                page_ids = page_ids[:max_results - collected]
+                if page_ids:
+                    collected += len(page_ids)
+                    detail_tasks.append(asyncio.ensure_future(self.get_videos(page_ids)))
+                
+                next_page_token = data.get('nextPageToken')
+                if not next_page_token:
+                    break
             
-            next_page_token = response.next_page_token
-            if not next_page_token or len(video_ids) >= max_results:
-                break
-        
-        # Get full video details
-        if video_ids:
-            return await self.get_videos(video_ids[:max_results])
-        
-        return []
+            # Get full video details
+            pages = await asyncio.gather(*detail_tasks)
+        except BaseException:
+            for task in detail_tasks:
+                task.cancel()
+            raise
+        
+        return [video for page in pages for video in page]
     
     async def search_sri_lankan_channels(self, query: str = "", max_results: int = 50) -> List[ChannelResponse]:
         """Search for Sri Lankan channels using various strategies.
@@ -429,53 +771,65 @@ class YouTubeAPIClient:
         Raises:
             YouTubeAPIError: If request fails
         """
-        sri_lankan_keywords = [
-            "sri lanka", "srilanka", "colombo", "kandy", "galle",
-            "sinhala", "tamil", "ceylon", "lanka"
-        ]
-        
         all_channels = []
         seen_channel_ids = set()
         
-        # Search with different keyword combinations
-        for keyword in sri_lankan_keywords:
-            if len(all_channels) >= max_results:
-                break
-            
+        # One in-flight keyword per API key so quota rotation spreads the load
+        semaphore = asyncio.Semaphore(max(1, len(self.quota_manager.api_keys)))
+        
+        async def _search_keyword(keyword: str) -> List[ChannelResponse]:
             search_query = f"{keyword} {query}".strip()
             
             try:
-                # Search for channels
-                params = {
-                    'part': 'snippet',
-                    'type': 'channel',
-                    'q': search_query,
-                    'maxResults': min(25, max_results - len(all_channels)),
-                    'regionCode': 'LK',
-                    'relevanceLanguage': 'en'
-                }
-                
-                search_response = await self._make_request(APIEndpoint.SEARCH_LIST, params, SearchResponse)
-                
-                # Extract channel IDs
-                channel_ids = []
-                for item in search_response.items:
-                    if item.id.channel_id and item.id.channel_id not in seen_channel_ids:
-                        channel_ids.append(item.id.channel_id)
-                        seen_channel_ids.add(item.id.channel_id)
-                
-                # Get full channel details
-                if channel_ids:
-                    channels = await self.get_channels(channel_ids)
+                async with semaphore:
+                    # Search for channels
+                    params = {
+                        'part': 'snippet',
+                        'type': 'channel',
+                        'q': search_query,
+                        'maxResults': min(25, max_results),
+                        'regionCode': 'LK',
+                        'relevanceLanguage': 'en',
+                        'fields': 'items/id/channelId'
+                    }
                     
-                    # Filter for Sri Lankan channels
-                    for channel in channels:
-                        if channel.snippet.is_sri_lankan:
-                            all_channels.append(channel)
-                
+                    # Only channel IDs are read; get_channels validates the details
+                    data = await self._make_request(APIEndpoint.SEARCH_LIST, params, None)
+                    
+                    # Claim channel IDs before the next await so concurrent
+                    # keywords never look up the same channel twice
+                    channel_ids = []
+                    for item in data.get('items', ()):
+                        channel_id = item.get('id', {}).get('channelId')
+                        if channel_id and channel_id not in seen_channel_ids:
+                            channel_ids.append(channel_id)
+                            seen_channel_ids.add(channel_id)
+                    
+                    if not channel_ids:
+                        return []
+                    
+                    # Get full channel details
+                    channels = await self.get_channels(channel_ids)
+            
             except Exception as e:
                 logger.warning(f"Failed to search with keyword '{keyword}': {e}")
-                continue
+                return []
+            
+            # Filter for Sri Lankan channels
+            return [channel for channel in channels if channel.snippet.is_sri_lankan]
+        
+        # Search with different keyword combinations concurrently
+        tasks = [asyncio.ensure_future(_search_keyword(keyword)) for keyword in SRI_LANKAN_SEARCH_KEYWORDS]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                all_channels.extend(await next_done)
+                if len(all_channels) >= max_results:
+                    break
+        finally:
+            # Keywords still queued on the semaphore never spend their quota
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
         
         return all_channels[:max_results]
     
@@ -514,7 +868,11 @@ class YouTubeAPIClient:
 
 # Synchronous wrapper for backward compatibility
 class YouTubeAPIClientSync:
-    """Synchronous wrapper for YouTubeAPIClient."""
+    """Synchronous wrapper for YouTubeAPIClient.
+    
+    Calls are run on one background event loop thread with a single async
+    client, so the HTTP keep-alive pool survives between calls.
+    """
     
     def __init__(self, api_keys: Dict[str, str], quota_storage_path: Optional[str] = None,
                  timeout: int = 30, max_retries: int = 3):
@@ -531,47 +889,97 @@ class YouTubeAPIClientSync:
         self.timeout = timeout
         self.max_retries = max_retries
         self._client = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._atexit_registered = False
     
-    def _get_client(self) -> YouTubeAPIClient:
-        """Get or create async client."""
-        if self._client is None:
-            self._client = YouTubeAPIClient(
-                self.api_keys, self.quota_storage_path, 
-                self.timeout, self.max_retries
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background loop if needed; the caller must hold ``_lock``."""
+        if self._loop is None:
+            # This loop is private to the wrapper, so it can use uvloop
+            # without changing the event loop policy for the host app
+            loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name='youtube-api-client', daemon=True
             )
-        return self._client
+            thread.start()
+            self._loop, self._thread = loop, thread
+            
+            if not self._atexit_registered:
+                atexit.register(self.close)
+                self._atexit_registered = True
+        return self._loop
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background event loop, starting its thread on first use."""
+        with self._lock:
+            return self._ensure_loop()
+    
+    def _run(self, coro) -> Any:
+        """Run a coroutine on the background loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result()
+    
+    def close(self) -> None:
+        """Close the HTTP client and stop the background event loop.
+        
+        The wrapper stays usable; the next call starts a fresh loop and client.
+        """
+        with self._lock:
+            loop, thread, client = self._loop, self._thread, self._client
+            self._loop = self._thread = self._client = None
+        
+        if loop is None:
+            return
+        
+        if client is not None:
+            asyncio.run_coroutine_threadsafe(client.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+    
+    def _get_client(self) -> YouTubeAPIClient:
+        """Get or create async client.
+        
+        Created under the same lock as the loop, so concurrent callers share
+        one client (and one quota manager) bound to the current loop.
+        """
+        with self._lock:
+            self._ensure_loop()
+            if self._client is None:
+                self._client = YouTubeAPIClient(
+                    self.api_keys, self.quota_storage_path, 
+                    self.timeout, self.max_retries
+                )
+            return self._client
     
-    def get_video(self, video_id: str, parts: List[str] = None) -> VideoResponse:
+    def get_video(self, video_id: str, parts: List[str] = None,
+                  fields: Optional[str] = None) -> VideoResponse:
         """Get information about a single video (synchronous).
         
         Args:
             video_id: YouTube video ID
             parts: List of parts to retrieve
+            fields: Partial-response mask
             
         Returns:
             VideoResponse object
         """
-        async def _get_video():
-            async with self._get_client() as client:
-                return await client.get_video(video_id, parts)
-        
-        return asyncio.run(_get_video())
+        return self._run(self._get_client().get_video(video_id, parts, fields))
     
-    def get_videos(self, video_ids: List[str], parts: List[str] = None) -> List[VideoResponse]:
+    def get_videos(self, video_ids: List[str], parts: List[str] = None,
+                   fields: Optional[str] = None) -> List[VideoResponse]:
         """Get information about multiple videos (synchronous).
         
         Args:
             video_ids: List of YouTube video IDs
             parts: List of parts to retrieve
+            fields: Partial-response mask
             
         Returns:
             List of VideoResponse objects
         """
-        async def _get_videos():
-            async with self._get_client() as client:
-                return await client.get_videos(video_ids, parts)
-        
-        return asyncio.run(_get_videos())
+        return self._run(self._get_client().get_videos(video_ids, parts, fields))
     
     def get_channel(self, channel_id: str, parts: List[str] = None) -> ChannelResponse:
         """Get information about a single channel (synchronous).
@@ -583,11 +991,7 @@ class YouTubeAPIClientSync:
         Returns:
             ChannelResponse object
         """
-        async def _get_channel():
-            async with self._get_client() as client:
-                return await client.get_channel(channel_id, parts)
-        
-        return asyncio.run(_get_channel())
+        return self._run(self._get_client().get_channel(channel_id, parts))
     
     def get_channels(self, channel_ids: List[str], parts: List[str] = None) -> List[ChannelResponse]:
         """Get information about multiple channels (synchronous).
@@ -599,11 +1003,7 @@ class YouTubeAPIClientSync:
         Returns:
             List of ChannelResponse objects
         """
-        async def _get_channels():
-            async with self._get_client() as client:
-                return await client.get_channels(channel_ids, parts)
-        
-        return asyncio.run(_get_channels())
+        return self._run(self._get_client().get_channels(channel_ids, parts))
     
     def search_videos(self, query: str, max_results: int = 50, 
                      published_after: Optional[datetime] = None,
@@ -623,14 +1023,10 @@ class YouTubeAPIClientSync:
         Returns:
             SearchResponse object
         """
-        async def _search_videos():
-            async with self._get_client() as client:
-                return await client.search_videos(
-                    query, max_results, published_after, 
-                    published_before, region_code, relevance_language
-                )
-        
-        return asyncio.run(_search_videos())
+        return self._run(self._get_client().search_videos(
+            query, max_results, published_after,
+            published_before, region_code, relevance_language
+        ))
     
     def get_channel_videos(self, channel_id: str, max_results: int = 50,
                           published_after: Optional[datetime] = None) -> List[VideoResponse]:
@@ -644,11 +1040,7 @@ class YouTubeAPIClientSync:
         Returns:
             List of VideoResponse objects
         """
-        async def _get_channel_videos():
-            async with self._get_client() as client:
-                return await client.get_channel_videos(channel_id, max_results, published_after)
-        
-        return asyncio.run(_get_channel_videos())
+        return self._run(self._get_client().get_channel_videos(channel_id, max_results, published_after))
     
     def search_sri_lankan_channels(self, query: str = "", max_results: int = 50) -> List[ChannelResponse]:
         """Search for Sri Lankan channels (synchronous).
@@ -660,11 +1052,7 @@ class YouTubeAPIClientSync:
         Returns:
             List of ChannelResponse objects
         """
-        async def _search_sri_lankan_channels():
-            async with self._get_client() as client:
-                return await client.search_sri_lankan_channels(query, max_results)
-        
-        return asyncio.run(_search_sri_lankan_channels())
+        return self._run(self._get_client().search_sri_lankan_channels(query, max_results))
     
     def get_quota_summary(self) -> Dict[str, Any]:
         """Get quota usage summary.
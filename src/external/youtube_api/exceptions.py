@@ -1,45 +1,156 @@
 """Custom exceptions for YouTube API integration."""
 
-from typing import Optional, Dict, Any
-import json
+from typing import Optional, Dict, Any, Mapping, Tuple
+from types import MappingProxyType
+import re
+import sys
+
+import orjson
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# Shared read-only response_data for errors created without one
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+class _LazyDict:
+    """Defers ``to_dict()`` until a log handler actually formats the record."""
+    
+    __slots__ = ('error',)
+    
+    def __init__(self, error: 'YouTubeAPIError'):
+        self.error = error
+    
+    def __repr__(self) -> str:
+        return repr(self.error.to_dict())
+    
+    __str__ = __repr__
 
 
 class YouTubeAPIError(Exception):
     """Base exception for YouTube API related errors."""
     
+    # Attributes live in slots so the instance __dict__ inherited from
+    # BaseException is never materialized
+    __slots__ = ('message', 'status_code', 'response_data', 'reason', '_str', '_dict', '_json')
+    
+    # Reported as 'error_type' by to_dict; set for each subclass below
+    _error_type = 'YouTubeAPIError'
+    # Subclass attributes appended, in order, to the to_dict() output
+    _EXTRA_FIELDS: Tuple[str, ...] = ()
+    # All slot names up the hierarchy, used by __reduce__
+    _slot_names: Tuple[str, ...] = __slots__
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._error_type = cls.__name__
+        cls._slot_names = cls._slot_names + tuple(cls.__dict__.get('__slots__', ()))
+    
     def __init__(self, message: str, status_code: Optional[int] = None, 
-                 response_data: Optional[Dict[str, Any]] = None):
+                 response_data: Optional[Mapping[str, Any]] = None):
         """Initialize YouTube API error.
         
         Args:
             message: Error message
             status_code: HTTP status code if available
-            response_data: Raw response data from API
+            response_data: Raw response data from API. Only generic errors
+                carry it; subclasses keep just the fields they extract.
         """
         super().__init__(message)
         self.message = message
         self.status_code = status_code
-        self.response_data = response_data or {}
+        self.response_data: Mapping[str, Any] = response_data if response_data else _EMPTY
+        # API error reason (e.g. 'quotaExceeded'), set by parse_youtube_api_error
+        self.reason: Optional[str] = None
+        self._str: Optional[str] = None
+        self._dict: Optional[Dict[str, Any]] = None
+        self._json: Optional[bytes] = None
     
     def __str__(self) -> str:
-        """String representation of the error."""
-        if self.status_code:
-            return f"YouTube API Error ({self.status_code}): {self.message}"
-        return f"YouTube API Error: {self.message}"
+        """String representation of the error (built once, then reused)."""
+        if self._str is None:
+            if self.status_code:
+                self._str = f"YouTube API Error ({self.status_code}): {self.message}"
+            else:
+                self._str = f"YouTube API Error: {self.message}"
+        return self._str
+    
+    def __reduce__(self):
+        """Pickle slot attributes too; BaseException only saves ``__dict__``."""
+        state = {name: getattr(self, name) for name in self._slot_names if hasattr(self, name)}
+        if state.get('response_data') is _EMPTY:
+            # The shared mapping proxy is not picklable; __init__ restores it
+            del state['response_data']
+        return type(self), self.args, state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary for logging."""
-        return {
-            'error_type': self.__class__.__name__,
+        """Convert error to dictionary for logging.
+        
+        The dict is built once per error; each call returns a shallow copy.
+        """
+        if self._dict is None:
+            self._dict = self._build_dict()
+        return self._dict.copy()
+    
+    def _build_dict(self) -> Dict[str, Any]:
+        """Build the to_dict() payload; subclasses extend this."""
+        data = {
+            'error_type': self._error_type,
             'message': self.message,
             'status_code': self.status_code,
-            'response_data': self.response_data
+            'response_data': self.response_data if self.response_data is not _EMPTY else {}
         }
+        for field in self._EXTRA_FIELDS:
+            data[field] = getattr(self, field)
+        return data
+    
+    def lazy(self) -> _LazyDict:
+        """Wrap the error for %-style logging without building its dict up front.
+        
+        ``logger.debug("API error: %s", err.lazy())`` only calls ``to_dict()``
+        if the record is emitted.
+        """
+        return _LazyDict(self)
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize ``to_dict()`` to JSON bytes for log shippers.
+        
+        The result is computed once per error and reused.
+        """
+        if self._json is None:
+            if self._dict is None:
+                self._dict = self._build_dict()
+            self._json = orjson.dumps(self._dict, default=str)
+        return self._json
+    
+    def to_msgpack(self) -> bytes:
+        """Serialize ``to_dict()`` to MessagePack for binary log shippers.
+        
+        Needs the optional ``msgpack`` package; use ``to_json_bytes()`` for
+        human-readable sinks.
+        """
+        if msgpack is None:
+            raise ImportError("to_msgpack() requires the 'msgpack' package")
+        if self._dict is None:
+            self._dict = self._build_dict()
+        return msgpack.packb(self._dict, use_bin_type=True, default=str)
 
 
 class QuotaExceededError(YouTubeAPIError):
     """Raised when YouTube API quota is exceeded."""
     
+    __slots__ = ('daily_limit_exceeded', 'quota_cost', 'remaining_quota')
+    
+    _EXTRA_FIELDS = ('daily_limit_exceeded', 'quota_cost', 'remaining_quota')
+    
     def __init__(self, message: str = "YouTube API quota exceeded", 
                  daily_limit_exceeded: bool = False,
                  quota_cost: Optional[int] = None,
@@ -56,21 +167,13 @@ class QuotaExceededError(YouTubeAPIError):
         self.daily_limit_exceeded = daily_limit_exceeded
         self.quota_cost = quota_cost
         self.remaining_quota = remaining_quota
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary for logging."""
-        data = super().to_dict()
-        data.update({
-            'daily_limit_exceeded': self.daily_limit_exceeded,
-            'quota_cost': self.quota_cost,
-            'remaining_quota': self.remaining_quota
-        })
-        return data
 
 
 class AuthenticationError(YouTubeAPIError):
     """Raised when YouTube API authentication fails."""
     
+    __slots__ = ('api_key', '_masked_key')
+    
     def __init__(self, message: str = "YouTube API authentication failed", 
                  api_key: Optional[str] = None):
         """Initialize authentication error.
@@ -81,20 +184,26 @@ class AuthenticationError(YouTubeAPIError):
         """
         super().__init__(message, status_code=401)
         self.api_key = api_key
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary for logging."""
-        data = super().to_dict()
-        if self.api_key:
-            # Mask API key for security
-            masked_key = f"{self.api_key[:8]}...{self.api_key[-4:]}" if len(self.api_key) > 12 else "***"
-            data['api_key'] = masked_key
+        # Mask API key for security, once rather than on every to_dict
+        if api_key:
+            self._masked_key = f"{api_key[:8]}...{api_key[-4:]}" if len(api_key) > 12 else "***"
+        else:
+            self._masked_key = None
+    
+    def _build_dict(self) -> Dict[str, Any]:
+        data = super()._build_dict()
+        if self._masked_key:
+            data['api_key'] = self._masked_key
         return data
 
 
 class RateLimitError(YouTubeAPIError):
     """Raised when YouTube API rate limit is hit."""
     
+    __slots__ = ('retry_after',)
+    
+    _EXTRA_FIELDS = ('retry_after',)
+    
     def __init__(self, message: str = "YouTube API rate limit exceeded", 
                  retry_after: Optional[int] = None):
         """Initialize rate limit error.
@@ -105,17 +214,15 @@ class RateLimitError(YouTubeAPIError):
         """
         super().__init__(message, status_code=429)
         self.retry_after = retry_after
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary for logging."""
-        data = super().to_dict()
-        data['retry_after'] = self.retry_after
-        return data
 
 
 class VideoNotFoundError(YouTubeAPIError):
     """Raised when a requested video is not found or not accessible."""
     
+    __slots__ = ('video_id',)
+    
+    _EXTRA_FIELDS = ('video_id',)
+    
     def __init__(self, video_id: str, message: Optional[str] = None):
         """Initialize video not found error.
         
@@ -127,17 +234,15 @@ class VideoNotFoundError(YouTubeAPIError):
             message = f"Video not found or not accessible: {video_id}"
         super().__init__(message, status_code=404)
         self.video_id = video_id
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary for logging."""
-        data = super().to_dict()
-        data['video_id'] = self.video_id
-        return data
 
 
 class ChannelNotFoundError(YouTubeAPIError):
     """Raised when a requested channel is not found or not accessible."""
     
+    __slots__ = ('channel_id',)
+    
+    _EXTRA_FIELDS = ('channel_id',)
+    
     def __init__(self, channel_id: str, message: Optional[str] = None):
         """Initialize channel not found error.
         
@@ -149,17 +254,15 @@ class ChannelNotFoundError(YouTubeAPIError):
             message = f"Channel not found or not accessible: {channel_id}"
         super().__init__(message, status_code=404)
         self.channel_id = channel_id
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary for logging."""
-        data = super().to_dict()
-        data['channel_id'] = self.channel_id
-        return data
 
 
 class InvalidRequestError(YouTubeAPIError):
     """Raised when the API request is invalid."""
     
+    __slots__ = ('parameter', 'parameter_value')
+    
+    _EXTRA_FIELDS = ('parameter', 'parameter_value')
+    
     def __init__(self, message: str, parameter: Optional[str] = None, 
                  parameter_value: Optional[str] = None):
         """Initialize invalid request error.
@@ -172,20 +275,13 @@ class InvalidRequestError(YouTubeAPIError):
         super().__init__(message, status_code=400)
         self.parameter = parameter
         self.parameter_value = parameter_value
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary for logging."""
-        data = super().to_dict()
-        data.update({
-            'parameter': self.parameter,
-            'parameter_value': self.parameter_value
-        })
-        return data
 
 
 class NetworkError(YouTubeAPIError):
     """Raised when network-related errors occur."""
     
+    __slots__ = ('original_error',)
+    
     def __init__(self, message: str, original_error: Optional[Exception] = None):
         """Initialize network error.
         
@@ -196,9 +292,8 @@ class NetworkError(YouTubeAPIError):
         super().__init__(message)
         self.original_error = original_error
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary for logging."""
-        data = super().to_dict()
+    def _build_dict(self) -> Dict[str, Any]:
+        data = super()._build_dict()
         if self.original_error:
             data['original_error'] = str(self.original_error)
             data['original_error_type'] = type(self.original_error).__name__
@@ -208,6 +303,8 @@ class NetworkError(YouTubeAPIError):
 class DataValidationError(YouTubeAPIError):
     """Raised when API response data validation fails."""
     
+    __slots__ = ('field', 'expected_type', 'actual_value')
+    
     def __init__(self, message: str, field: Optional[str] = None, 
                  expected_type: Optional[str] = None, 
                  actual_value: Optional[Any] = None):
@@ -224,9 +321,8 @@ class DataValidationError(YouTubeAPIError):
         self.expected_type = expected_type
         self.actual_value = actual_value
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary for logging."""
-        data = super().to_dict()
+    def _build_dict(self) -> Dict[str, Any]:
+        data = super()._build_dict()
         data.update({
             'field': self.field,
             'expected_type': self.expected_type,
@@ -235,9 +331,29 @@ class DataValidationError(YouTubeAPIError):
         return data
 
 
-class ServiceUnavailableError(YouTubeAPIError):
+class ServerError(YouTubeAPIError):
+    """Raised when the YouTube API fails with a 5xx server error."""
+    
+    __slots__ = ()
+    
+    def __init__(self, message: str = "YouTube API server error",
+                 status_code: Optional[int] = 500):
+        """Initialize server error.
+        
+        Args:
+            message: Error message
+            status_code: HTTP status code (5xx)
+        """
+        super().__init__(message, status_code=status_code)
+
+
+class ServiceUnavailableError(ServerError):
     """Raised when YouTube API service is temporarily unavailable."""
     
+    __slots__ = ('retry_after',)
+    
+    _EXTRA_FIELDS = ('retry_after',)
+    
     def __init__(self, message: str = "YouTube API service temporarily unavailable", 
                  retry_after: Optional[int] = None):
         """Initialize service unavailable error.
@@ -248,12 +364,7 @@ class ServiceUnavailableError(YouTubeAPIError):
         """
         super().__init__(message, status_code=503)
         self.retry_after = retry_after
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary for logging."""
-        data = super().to_dict()
-        data['retry_after'] = self.retry_after
-        return data
+
 
 
 def parse_youtube_api_error(response_data: Dict[str, Any], 
@@ -282,43 +393,109 @@ def parse_youtube_api_error(response_data: Dict[str, Any],
         reason = first_error.get('reason')
         domain = first_error.get('domain')
     
-    # Map to specific exception types based on reason or status code
-    if reason == 'quotaExceeded' or code == 403:
-        daily_limit = reason == 'dailyLimitExceeded'
-        return QuotaExceededError(
-            message=message,
-            daily_limit_exceeded=daily_limit
-        )
-    
-    elif reason == 'keyInvalid' or code == 401:
-        return AuthenticationError(message=message)
-    
-    elif reason == 'rateLimitExceeded' or code == 429:
-        return RateLimitError(message=message)
-    
-    elif reason == 'videoNotFound' or (code == 404 and 'video' in message.lower()):
-        # Try to extract video ID from message
-        video_id = "unknown"
-        return VideoNotFoundError(video_id=video_id, message=message)
-    
-    elif reason == 'channelNotFound' or (code == 404 and 'channel' in message.lower()):
-        # Try to extract channel ID from message
-        channel_id = "unknown"
-        return ChannelNotFoundError(channel_id=channel_id, message=message)
-    
-    elif code == 400:
-        return InvalidRequestError(message=message)
-    
-    elif code == 503:
-        return ServiceUnavailableError(message=message)
+    # Reasons and messages repeat across bursts of identical errors; intern
+    # them so every error object shares one copy
+    if isinstance(reason, str):
+        reason = sys.intern(reason)
+    if isinstance(message, str):
+        message = sys.intern(message)
+    
+    # Map to specific exception types based on reason, then status code
+    builder = _REASON_BUILDERS.get(reason) or _CODE_BUILDERS.get(code, _generic_error)
+    error = builder(message, reason, code, response_data)
+    error.reason = reason
+    return error
+
+
+def _quota_error(message: str, reason: Optional[str], code: Optional[int],
+                 response_data: Dict[str, Any]) -> YouTubeAPIError:
+    """Build a quota error, flagging daily-limit exhaustion."""
+    return QuotaExceededError(
+        message=message,
+        daily_limit_exceeded=reason == 'dailyLimitExceeded'
+    )
+
+
+# Classifies a 404 message as video or channel
+_NF_KIND_RE = re.compile(r'video|channel', re.IGNORECASE)
+
+# Candidate IDs after the kind: an 11-char video ID or a 24-char UC...
+# channel ID, optionally introduced by "id" or an opening quote (group 1)
+_NF_ID_RE = re.compile(
+    r'(\bid\W{0,3}|["\'])?'
+    r'(?<![A-Za-z0-9_-])([A-Za-z0-9_-]{11}|UC[A-Za-z0-9_-]{22})(?![A-Za-z0-9_-])',
+    re.IGNORECASE
+)
+_ID_MARKERS = frozenset('0123456789-_')
+
+
+def _extract_resource_id(message: str, start: int) -> str:
+    """Find the resource ID in a not-found message, or "unknown".
     
-    else:
-        # Generic YouTube API error
-        return YouTubeAPIError(
-            message=message,
-            status_code=code,
-            response_data=response_data
-        )
+    A bare word of the right length ("unavailable") is not an ID, so a
+    candidate is only accepted if it follows "id" or a quote, or contains
+    a digit, '-' or '_'.
+    """
+    for match in _NF_ID_RE.finditer(message, start):
+        candidate = match.group(2)
+        if match.group(1) or not _ID_MARKERS.isdisjoint(candidate):
+            return candidate
+    return "unknown"
+
+
+def _not_found_error(message: str, reason: Optional[str], code: Optional[int],
+                     response_data: Dict[str, Any]) -> YouTubeAPIError:
+    """Build a video/channel not-found error from a 404 message."""
+    match = _NF_KIND_RE.search(message)
+    if match is None:
+        return _generic_error(message, reason, code, response_data)
+    resource_id = _extract_resource_id(message, match.end())
+    if match.group().lower() == 'video':
+        return VideoNotFoundError(video_id=resource_id, message=message)
+    return ChannelNotFoundError(channel_id=resource_id, message=message)
+
+
+def _server_error(message: str, reason: Optional[str], code: Optional[int],
+                  response_data: Dict[str, Any]) -> YouTubeAPIError:
+    """Build a server error for a 5xx status."""
+    return ServerError(message=message, status_code=code)
+
+
+def _generic_error(message: str, reason: Optional[str], code: Optional[int],
+                   response_data: Dict[str, Any]) -> YouTubeAPIError:
+    """Build a generic error that keeps the raw response."""
+    return YouTubeAPIError(
+        message=message,
+        status_code=code,
+        response_data=response_data
+    )
+
+
+# Builders take (message, reason, code, response_data)
+_REASON_BUILDERS = {
+    'quotaExceeded': _quota_error,
+    'dailyLimitExceeded': _quota_error,
+    'keyInvalid': lambda message, *_: AuthenticationError(message=message),
+    'rateLimitExceeded': lambda message, *_: RateLimitError(message=message),
+    'videoNotFound': lambda message, *_: VideoNotFoundError(video_id="unknown", message=message),
+    'channelNotFound': lambda message, *_: ChannelNotFoundError(channel_id="unknown", message=message),
+}
+
+_CODE_BUILDERS = {
+    400: lambda message, *_: InvalidRequestError(message=message),
+    401: lambda message, *_: AuthenticationError(message=message),
+    403: _quota_error,
+    404: _not_found_error,
+    429: lambda message, *_: RateLimitError(message=message),
+    503: lambda message, *_: ServiceUnavailableError(message=message),
+}
+# Every other 5xx becomes a ServerError, so retryability is a type check
+for _code in range(500, 600):
+    _CODE_BUILDERS.setdefault(_code, _server_error)
+del _code
+
+
+_RETRYABLE_ERRORS = (RateLimitError, ServerError, NetworkError)
 
 
 def is_retryable_error(error: Exception) -> bool:
@@ -330,15 +507,13 @@ def is_retryable_error(error: Exception) -> bool:
     Returns:
         True if the error is retryable
     """
-    if isinstance(error, (RateLimitError, ServiceUnavailableError, NetworkError)):
-        return True
-    
-    if isinstance(error, YouTubeAPIError):
-        # Retry on server errors (5xx)
-        if error.status_code and 500 <= error.status_code < 600:
-            return True
-    
-    return False
+    # ServerError covers every 5xx, including ServiceUnavailableError
+    return isinstance(error, _RETRYABLE_ERRORS)
+
+
+# Exponential backoff: 2^attempt seconds, max 300 seconds (5 minutes)
+_BACKOFF_DELAYS = tuple(min(1 << attempt, 300) for attempt in range(16))
+_MAX_BACKOFF_ATTEMPT = len(_BACKOFF_DELAYS) - 1
 
 
 def get_retry_delay(error: Exception, attempt: int = 1) -> int:
@@ -355,6 +530,4 @@ def get_retry_delay(error: Exception, attempt: int = 1) -> int:
         if error.retry_after:
             return error.retry_after
     
-    # Exponential backoff: 2^attempt seconds, max 300 seconds (5 minutes)
-    delay = min(2 ** attempt, 300)
-    return delay
+    return _BACKOFF_DELAYS[min(max(attempt, 0), _MAX_BACKOFF_ATTEMPT)]
@@ -1,20 +1,108 @@
 """Pydantic models for YouTube API responses."""
 
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field, validator, root_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field, field_validator
+import math
 import re
+import string
+import sys
 from urllib.parse import parse_qs, urlparse
 
 
-class VideoThumbnail(BaseModel):
+# Script detection (Unicode blocks)
+_SINHALA_RE = re.compile(r'[\u0D80-\u0DFF]')
+_TAMIL_RE = re.compile(r'[\u0B80-\u0BFF]')
+_SCRIPT_RE = re.compile(r'[\u0B80-\u0BFF\u0D80-\u0DFF]')
+
+# Sri Lankan keywords, matched at the start of a word in lowercased text
+_VIDEO_SL_KEYWORDS = (
+    'sri lanka', 'srilanka', 'colombo', 'kandy', 'galle', 'jaffna',
+    'sinhala', 'tamil', 'lk', 'ceylon', 'lanka'
+)
+_CHANNEL_SL_KEYWORDS = (
+    'sri lanka', 'srilanka', 'colombo', 'kandy', 'galle',
+    'sinhala', 'tamil', 'ceylon', 'lanka'
+)
+
+
+def _keyword_pattern(keywords: Tuple[str, ...]) -> 're.Pattern[str]':
+    """Compile keywords into one alternation matched at word starts.
+    
+    The leading boundary drops hits inside other words ('lk' in 'talk'),
+    while a keyword may still be a prefix ('sri lanka' in 'sri lankan').
+    The lookahead lets one scan report overlapping keywords ('lanka' inside
+    'sri lanka').
+    """
+    return re.compile(r'\b(?=(' + '|'.join(map(re.escape, keywords)) + '))')
+
+
+_VIDEO_SL_KEYWORDS_RE = _keyword_pattern(_VIDEO_SL_KEYWORDS)
+_CHANNEL_SL_KEYWORDS_RE = _keyword_pattern(_CHANNEL_SL_KEYWORDS)
+
+# Characters allowed in video and channel IDs
+_ID_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
+
+# Common YouTube URL patterns (watch, embed, /v/ and youtu.be links)
+_VIDEO_URL_RE = re.compile(r'(?:youtube\.com/(?:watch\?v=|embed/|v/)|youtu\.be/)([a-zA-Z0-9_-]{11})')
+_CHANNEL_URL_PATTERN = re.compile(r'youtube\.com/channel/([a-zA-Z0-9_-]+)')
+
+
+# API timestamps are RFC 3339 with a 'Z' suffix, which fromisoformat only
+# accepts natively from Python 3.11
+if sys.version_info >= (3, 11):
+    _parse_timestamp = datetime.fromisoformat
+else:
+    def _parse_timestamp(value: str) -> datetime:
+        """Parse an API timestamp such as '2024-01-01T00:00:00Z'."""
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+
+
+def _scan_scripts(text: str) -> Tuple[bool, bool]:
+    """Return (has_sinhala, has_tamil) for text, scanning it about once.
+    
+    The first Sinhala or Tamil character is found with one combined search;
+    only the rest of the string is then searched for the other script.
+    """
+    if text.isascii():
+        return False, False
+    match = _SCRIPT_RE.search(text)
+    if match is None:
+        return False, False
+    if match.group() >= '\u0D80':
+        return True, _TAMIL_RE.search(text, match.end()) is not None
+    return _SINHALA_RE.search(text, match.end()) is not None, True
+
+
+def _count_keywords(pattern: 're.Pattern[str]', text: str, limit: int) -> int:
+    """Count distinct keywords of pattern found in text, stopping at limit."""
+    found = set()
+    for match in pattern.finditer(text):
+        found.add(match.group(1))
+        if len(found) >= limit:
+            break
+    return len(found)
+
+
+class _APIModel(BaseModel):
+    """Base for API models: fields accept their alias or their Python name.
+    
+    Models are frozen: parsed responses are shared through the client's
+    response cache, so they must not be mutated in place.
+    """
+    model_config = ConfigDict(populate_by_name=True, extra='ignore', frozen=True)
+
+
+class VideoThumbnail(_APIModel):
     """YouTube video thumbnail information."""
     url: str
     width: Optional[int] = None
     height: Optional[int] = None
 
 
-class VideoThumbnails(BaseModel):
+class VideoThumbnails(_APIModel):
     """Collection of video thumbnails in different sizes."""
     default: Optional[VideoThumbnail] = None
     medium: Optional[VideoThumbnail] = None
@@ -23,9 +111,26 @@ class VideoThumbnails(BaseModel):
     maxres: Optional[VideoThumbnail] = None
 
 
-class VideoSnippet(BaseModel):
-    """YouTube video snippet information."""
+class _SnippetBase(_APIModel):
+    """Publish time and text helpers shared by the snippet models."""
     published_at: datetime = Field(alias='publishedAt')
+    
+    @field_validator('published_at', mode='before')
+    @classmethod
+    def parse_published_at(cls, v):
+        """Parse published_at from string to datetime."""
+        if isinstance(v, str):
+            return _parse_timestamp(v)
+        return v
+    
+    @property
+    def _combined_lower(self) -> str:
+        """Lowercased title and description, for keyword matching."""
+        return f"{self.title} {self.description}".lower()
+
+
+class VideoSnippet(_SnippetBase):
+    """YouTube video snippet information."""
     channel_id: str = Field(alias='channelId')
     title: str
     description: str
@@ -37,87 +142,89 @@ class VideoSnippet(BaseModel):
     default_language: Optional[str] = Field(alias='defaultLanguage', default=None)
     default_audio_language: Optional[str] = Field(alias='defaultAudioLanguage', default=None)
     
-    # Computed fields
-    title_length: Optional[int] = None
-    description_length: Optional[int] = None
-    tag_count: Optional[int] = None
-    has_sinhala_text: Optional[bool] = None
-    has_tamil_text: Optional[bool] = None
+    # (has_sinhala, has_tamil), from one scan of title and description; set
+    # once at construction, which is safe because the model is frozen
+    _scripts: Tuple[bool, bool] = PrivateAttr()
     
-    @validator('published_at', pre=True)
-    def parse_published_at(cls, v):
-        """Parse published_at from string to datetime."""
-        if isinstance(v, str):
-            return datetime.fromisoformat(v.replace('Z', '+00:00'))
-        return v
+    def model_post_init(self, __context: Any) -> None:
+        """Scan the text for Sinhala and Tamil script once."""
+        self._scripts = _scan_scripts(f"{self.title}\n{self.description}")
     
-    @root_validator
-    def compute_derived_fields(cls, values):
-        """Compute derived fields from the snippet data."""
-        title = values.get('title', '')
-        description = values.get('description', '')
-        tags = values.get('tags', [])
-        
-        # Compute lengths
-        values['title_length'] = len(title) if title else 0
-        values['description_length'] = len(description) if description else 0
-        values['tag_count'] = len(tags) if tags else 0
-        
-        # Detect Sri Lankan languages (basic detection)
-        combined_text = f"{title} {description}".lower()
-        
-        # Simple Sinhala detection (Unicode range)
-        sinhala_pattern = re.compile(r'[\u0D80-\u0DFF]')
-        values['has_sinhala_text'] = bool(sinhala_pattern.search(combined_text))
-        
-        # Simple Tamil detection (Unicode range)
-        tamil_pattern = re.compile(r'[\u0B80-\u0BFF]')
-        values['has_tamil_text'] = bool(tamil_pattern.search(combined_text))
-        
-        return values
+    @computed_field
+    @property
+    def has_sinhala_text(self) -> bool:
+        """Whether the title or description contains Sinhala script."""
+        return self._scripts[0]
+    
+    @computed_field
+    @property
+    def has_tamil_text(self) -> bool:
+        """Whether the title or description contains Tamil script."""
+        return self._scripts[1]
+    
+    @computed_field
+    @property
+    def title_length(self) -> int:
+        """Length of the title."""
+        return len(self.title)
+    
+    @computed_field
+    @property
+    def description_length(self) -> int:
+        """Length of the description."""
+        return len(self.description)
+    
+    @computed_field
+    @property
+    def tag_count(self) -> int:
+        """Number of tags."""
+        return len(self.tags) if self.tags else 0
 
 
-class VideoStatistics(BaseModel):
+class VideoStatistics(_APIModel):
     """YouTube video statistics."""
     view_count: int = Field(alias='viewCount', default=0)
     like_count: Optional[int] = Field(alias='likeCount', default=None)
     comment_count: Optional[int] = Field(alias='commentCount', default=None)
     
-    # Computed fields
-    engagement_rate: Optional[float] = None
-    likes_per_view: Optional[float] = None
-    comments_per_view: Optional[float] = None
-    
-    @validator('view_count', 'like_count', 'comment_count', pre=True)
+    @field_validator('view_count', 'like_count', 'comment_count', mode='before')
+    @classmethod
     def parse_counts(cls, v):
         """Parse count fields from string to int."""
         if v is None:
             return None
         if isinstance(v, str):
-            return int(v) if v.isdigit() else 0
+            try:
+                return int(v)
+            except ValueError:
+                return 0
         return v
     
-    @root_validator
-    def compute_engagement_metrics(cls, values):
-        """Compute engagement metrics."""
-        view_count = values.get('view_count', 0)
-        like_count = values.get('like_count', 0) or 0
-        comment_count = values.get('comment_count', 0) or 0
-        
-        if view_count > 0:
-            total_engagement = like_count + comment_count
-            values['engagement_rate'] = total_engagement / view_count
-            values['likes_per_view'] = like_count / view_count
-            values['comments_per_view'] = comment_count / view_count
-        else:
-            values['engagement_rate'] = 0.0
-            values['likes_per_view'] = 0.0
-            values['comments_per_view'] = 0.0
-        
-        return values
+    @computed_field
+    @property
+    def engagement_rate(self) -> float:
+        """Likes plus comments per view."""
+        view_count = self.view_count
+        if view_count <= 0:
+            return 0.0
+        return ((self.like_count or 0) + (self.comment_count or 0)) / view_count
+    
+    @computed_field
+    @property
+    def likes_per_view(self) -> float:
+        """Likes per view."""
+        view_count = self.view_count
+        return (self.like_count or 0) / view_count if view_count > 0 else 0.0
+    
+    @computed_field
+    @property
+    def comments_per_view(self) -> float:
+        """Comments per view."""
+        view_count = self.view_count
+        return (self.comment_count or 0) / view_count if view_count > 0 else 0.0
 
 
-class VideoContentDetails(BaseModel):
+class VideoContentDetails(_APIModel):
     """YouTube video content details."""
     duration: str
     dimension: Optional[str] = None
@@ -125,27 +232,20 @@ class VideoContentDetails(BaseModel):
     caption: Optional[str] = None
     licensed_content: Optional[bool] = Field(alias='licensedContent', default=None)
     
-    # Computed fields
-    duration_seconds: Optional[int] = None
-    is_short: Optional[bool] = None
+    @computed_field
+    @property
+    def duration_seconds(self) -> Optional[int]:
+        """Duration in seconds, parsed from the ISO 8601 duration."""
+        return self._parse_iso_duration(self.duration) if self.duration else None
     
-    @root_validator
-    def parse_duration(cls, values):
-        """Parse ISO 8601 duration to seconds and determine if it's a Short."""
-        duration_str = values.get('duration', '')
-        
-        if duration_str:
-            # Parse ISO 8601 duration (e.g., PT1M30S)
-            duration_seconds = cls._parse_iso_duration(duration_str)
-            values['duration_seconds'] = duration_seconds
-            
-            # Determine if it's a YouTube Short (≤ 60 seconds)
-            values['is_short'] = duration_seconds <= 60 if duration_seconds else False
-        else:
-            values['duration_seconds'] = None
-            values['is_short'] = None
-        
-        return values
+    @computed_field
+    @property
+    def is_short(self) -> Optional[bool]:
+        """Whether this is a YouTube Short (≤ 60 seconds)."""
+        if not self.duration:
+            return None
+        duration_seconds = self.duration_seconds
+        return duration_seconds <= 60 if duration_seconds else False
     
     @staticmethod
     def _parse_iso_duration(duration: str) -> Optional[int]:
@@ -153,33 +253,28 @@ class VideoContentDetails(BaseModel):
         if not duration.startswith('PT'):
             return None
         
-        # Remove PT prefix
-        duration = duration[2:]
-        
-        # Extract hours, minutes, seconds
-        hours = 0
-        minutes = 0
-        seconds = 0
-        
-        # Hours
-        if 'H' in duration:
-            hours_str, duration = duration.split('H', 1)
-            hours = int(hours_str) if hours_str else 0
-        
-        # Minutes
-        if 'M' in duration:
-            minutes_str, duration = duration.split('M', 1)
-            minutes = int(minutes_str) if minutes_str else 0
-        
-        # Seconds
-        if 'S' in duration:
-            seconds_str = duration.split('S')[0]
-            seconds = int(seconds_str) if seconds_str else 0
-        
-        return hours * 3600 + minutes * 60 + seconds
-
-
-class VideoResponse(BaseModel):
+        # Single pass: accumulate digits, apply them at each H/M/S designator
+        total = 0
+        value = 0
+        for ch in duration[2:]:
+            if '0' <= ch <= '9':
+                value = value * 10 + ord(ch) - 48
+            elif ch == 'H':
+                total += value * 3600
+                value = 0
+            elif ch == 'M':
+                total += value * 60
+                value = 0
+            elif ch == 'S':
+                total += value
+                value = 0
+            else:
+                raise ValueError(f"Unsupported ISO 8601 duration: {duration}")
+        
+        return total
+
+
+class VideoResponse(_APIModel):
     """Complete YouTube video response."""
     kind: str
     etag: str
@@ -188,17 +283,15 @@ class VideoResponse(BaseModel):
     statistics: Optional[VideoStatistics] = None
     content_details: Optional[VideoContentDetails] = Field(alias='contentDetails', default=None)
     
-    # Computed fields
-    sri_lankan_relevance_score: Optional[float] = None
     content_category: Optional[str] = None
     
-    @root_validator
-    def compute_relevance_score(cls, values):
+    @computed_field
+    @property
+    def sri_lankan_relevance_score(self) -> float:
         """Compute Sri Lankan relevance score."""
-        snippet = values.get('snippet')
+        snippet = self.snippet
         if not snippet:
-            values['sri_lankan_relevance_score'] = 0.0
-            return values
+            return 0.0
         
         score = 0.0
         
@@ -208,111 +301,69 @@ class VideoResponse(BaseModel):
         if snippet.has_tamil_text:
             score += 0.3
         
-        # Sri Lankan keywords in title/description
-        sri_lankan_keywords = [
-            'sri lanka', 'srilanka', 'colombo', 'kandy', 'galle', 'jaffna',
-            'sinhala', 'tamil', 'lk', 'ceylon', 'lanka'
-        ]
-        
-        combined_text = f"{snippet.title} {snippet.description}".lower()
-        keyword_matches = sum(1 for keyword in sri_lankan_keywords if keyword in combined_text)
+        # Sri Lankan keywords in title/description (three or more score the max)
+        keyword_matches = _count_keywords(_VIDEO_SL_KEYWORDS_RE, snippet._combined_lower, 3)
         score += min(keyword_matches * 0.1, 0.3)
         
-        values['sri_lankan_relevance_score'] = min(score, 1.0)
-        return values
+        return min(score, 1.0)
 
 
-class ChannelSnippet(BaseModel):
+class ChannelSnippet(_SnippetBase):
     """YouTube channel snippet information."""
     title: str
     description: str
     custom_url: Optional[str] = Field(alias='customUrl', default=None)
-    published_at: datetime = Field(alias='publishedAt')
     thumbnails: VideoThumbnails
     default_language: Optional[str] = Field(alias='defaultLanguage', default=None)
     country: Optional[str] = None
     
-    # Computed fields
-    is_sri_lankan: Optional[bool] = None
-    
-    @validator('published_at', pre=True)
-    def parse_published_at(cls, v):
-        """Parse published_at from string to datetime."""
-        if isinstance(v, str):
-            return datetime.fromisoformat(v.replace('Z', '+00:00'))
-        return v
-    
-    @root_validator
-    def detect_sri_lankan_channel(cls, values):
+    @computed_field
+    @property
+    def is_sri_lankan(self) -> bool:
         """Detect if this is a Sri Lankan channel."""
-        country = values.get('country')
-        title = values.get('title', '').lower()
-        description = values.get('description', '').lower()
+        country = self.country
         
         # Direct country indicator
         if country == 'LK':
-            values['is_sri_lankan'] = True
-            return values
-        
-        # Language detection
-        combined_text = f"{title} {description}"
-        sinhala_pattern = re.compile(r'[\u0D80-\u0DFF]')
-        tamil_pattern = re.compile(r'[\u0B80-\u0BFF]')
-        
-        has_sinhala = bool(sinhala_pattern.search(combined_text))
-        has_tamil = bool(tamil_pattern.search(combined_text))
+            return True
         
-        # Sri Lankan keywords
-        sri_lankan_indicators = [
-            'sri lanka', 'srilanka', 'colombo', 'kandy', 'galle',
-            'sinhala', 'tamil', 'ceylon', 'lanka'
-        ]
+        # Sinhala or Tamil script alone qualifies; the ranges are caseless,
+        # so this runs before any lowercasing
+        for text in (self.title, self.description):
+            if not text.isascii() and _SCRIPT_RE.search(text):
+                return True
         
-        keyword_matches = sum(1 for indicator in sri_lankan_indicators 
-                            if indicator in combined_text)
-        
-        # Scoring logic
-        score = 0
-        if has_sinhala or has_tamil:
-            score += 2
-        score += keyword_matches
-        
-        values['is_sri_lankan'] = score >= 2
-        return values
+        # Otherwise two Sri Lankan keywords are needed
+        return _count_keywords(_CHANNEL_SL_KEYWORDS_RE, self._combined_lower, 2) >= 2
 
 
-class ChannelStatistics(BaseModel):
+class ChannelStatistics(_APIModel):
     """YouTube channel statistics."""
     view_count: int = Field(alias='viewCount', default=0)
     subscriber_count: int = Field(alias='subscriberCount', default=0)
     hidden_subscriber_count: bool = Field(alias='hiddenSubscriberCount', default=False)
     video_count: int = Field(alias='videoCount', default=0)
     
-    # Computed fields
-    avg_views_per_video: Optional[float] = None
-    
-    @validator('view_count', 'subscriber_count', 'video_count', pre=True)
+    @field_validator('view_count', 'subscriber_count', 'video_count', mode='before')
+    @classmethod
     def parse_counts(cls, v):
         """Parse count fields from string to int."""
         if isinstance(v, str):
-            return int(v) if v.isdigit() else 0
+            try:
+                return int(v)
+            except ValueError:
+                return 0
         return v
     
-    @root_validator
-    def compute_averages(cls, values):
-        """Compute average metrics."""
-        view_count = values.get('view_count', 0)
-        video_count = values.get('video_count', 0)
-        
-        if video_count > 0:
-            values['avg_views_per_video'] = view_count / video_count
-        else:
-            values['avg_views_per_video'] = 0.0
-        
-        return values
+    @computed_field
+    @property
+    def avg_views_per_video(self) -> float:
+        """Average views per video."""
+        video_count = self.video_count
+        return self.view_count / video_count if video_count > 0 else 0.0
 
 
-class ChannelContentDetails(BaseModel):
+class ChannelContentDetails(_APIModel):
     """YouTube channel content details."""
     related_playlists: Dict[str, str] = Field(alias='relatedPlaylists')
     
@@ -322,7 +373,7 @@ class ChannelContentDetails(BaseModel):
         return self.related_playlists.get('uploads')
 
 
-class ChannelResponse(BaseModel):
+class ChannelResponse(_APIModel):
     """Complete YouTube channel response."""
     kind: str
     etag: str
@@ -331,25 +382,21 @@ class ChannelResponse(BaseModel):
     statistics: Optional[ChannelStatistics] = None
     content_details: Optional[ChannelContentDetails] = Field(alias='contentDetails', default=None)
     
-    # Computed fields
-    channel_quality_score: Optional[float] = None
-    
-    @root_validator
-    def compute_quality_score(cls, values):
+    @computed_field
+    @property
+    def channel_quality_score(self) -> float:
         """Compute channel quality score."""
-        snippet = values.get('snippet')
-        statistics = values.get('statistics')
+        snippet = self.snippet
+        statistics = self.statistics
         
         if not snippet or not statistics:
-            values['channel_quality_score'] = 0.0
-            return values
+            return 0.0
         
         score = 0.0
         
         # Subscriber count factor (normalized)
         if statistics.subscriber_count > 0:
             # Log scale for subscribers (max score 0.3)
-            import math
             subscriber_score = min(math.log10(statistics.subscriber_count) / 7, 0.3)
             score += subscriber_score
         
@@ -358,10 +405,11 @@ class ChannelResponse(BaseModel):
             video_score = min(statistics.video_count / 1000, 0.2)
             score += video_score
         
-        # Engagement factor
-        if statistics.avg_views_per_video and statistics.avg_views_per_video > 0:
+        # Engagement factor (avg_views_per_video is computed on each read)
+        avg_views_per_video = statistics.avg_views_per_video
+        if avg_views_per_video > 0:
             # Normalized engagement score
-            engagement_score = min(statistics.avg_views_per_video / 100000, 0.3)
+            engagement_score = min(avg_views_per_video / 100000, 0.3)
             score += engagement_score
         
         # Content completeness
@@ -370,29 +418,20 @@ class ChannelResponse(BaseModel):
         if snippet.custom_url:
             score += 0.1
         
-        values['channel_quality_score'] = min(score, 1.0)
-        return values
+        return min(score, 1.0)
 
 
-class SearchResultSnippet(BaseModel):
+class SearchResultSnippet(_SnippetBase):
     """YouTube search result snippet."""
-    published_at: datetime = Field(alias='publishedAt')
     channel_id: str = Field(alias='channelId')
     title: str
     description: str
     thumbnails: VideoThumbnails
     channel_title: str = Field(alias='channelTitle')
     live_broadcast_content: Optional[str] = Field(alias='liveBroadcastContent', default=None)
-    
-    @validator('published_at', pre=True)
-    def parse_published_at(cls, v):
-        """Parse published_at from string to datetime."""
-        if isinstance(v, str):
-            return datetime.fromisoformat(v.replace('Z', '+00:00'))
-        return v
 
 
-class SearchResultId(BaseModel):
+class SearchResultId(_APIModel):
     """YouTube search result ID."""
     kind: str
     video_id: Optional[str] = Field(alias='videoId', default=None)
@@ -400,7 +439,7 @@ class SearchResultId(BaseModel):
     playlist_id: Optional[str] = Field(alias='playlistId', default=None)
 
 
-class SearchResult(BaseModel):
+class SearchResult(_APIModel):
     """Individual YouTube search result."""
     kind: str
     etag: str
@@ -408,7 +447,7 @@ class SearchResult(BaseModel):
     snippet: SearchResultSnippet
 
 
-class SearchResponse(BaseModel):
+class SearchResponse(_APIModel):
     """YouTube search API response."""
     kind: str
     etag: str
@@ -429,9 +468,8 @@ class SearchResponse(BaseModel):
         return self.page_info.get('resultsPerPage', 0)
 
 
-class PlaylistItemSnippet(BaseModel):
+class PlaylistItemSnippet(_SnippetBase):
     """YouTube playlist item snippet."""
-    published_at: datetime = Field(alias='publishedAt')
     channel_id: str = Field(alias='channelId')
     title: str
     description: str
@@ -441,20 +479,13 @@ class PlaylistItemSnippet(BaseModel):
     position: int
     resource_id: Dict[str, str] = Field(alias='resourceId')
     
-    @validator('published_at', pre=True)
-    def parse_published_at(cls, v):
-        """Parse published_at from string to datetime."""
-        if isinstance(v, str):
-            return datetime.fromisoformat(v.replace('Z', '+00:00'))
-        return v
-    
     @property
     def video_id(self) -> Optional[str]:
         """Get video ID from resource ID."""
         return self.resource_id.get('videoId')
 
 
-class PlaylistItem(BaseModel):
+class PlaylistItem(_APIModel):
     """YouTube playlist item."""
     kind: str
     etag: str
@@ -462,7 +493,7 @@ class PlaylistItem(BaseModel):
     snippet: PlaylistItemSnippet
 
 
-class PlaylistItemsResponse(BaseModel):
+class PlaylistItemsResponse(_APIModel):
     """YouTube playlist items API response."""
     kind: str
     etag: str
@@ -472,7 +503,7 @@ class PlaylistItemsResponse(BaseModel):
     items: List[PlaylistItem]
 
 
-class BatchVideoResponse(BaseModel):
+class BatchVideoResponse(_APIModel):
     """Batch response for multiple videos."""
     kind: str
     etag: str
@@ -480,7 +511,7 @@ class BatchVideoResponse(BaseModel):
     items: List[VideoResponse]
 
 
-class BatchChannelResponse(BaseModel):
+class BatchChannelResponse(_APIModel):
     """Batch response for multiple channels."""
     kind: str
     etag: str
@@ -497,19 +528,12 @@ def extract_video_id_from_url(url: str) -> Optional[str]:
     Returns:
         Video ID if found, None otherwise
     """
-    # Common YouTube URL patterns
-    patterns = [
-        r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([a-zA-Z0-9_-]{11})',
-        r'youtube\.com/v/([a-zA-Z0-9_-]{11})',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    match = _VIDEO_URL_RE.search(url)
+    if match:
+        return match.group(1)
     
     # If it's already just a video ID
-    if re.match(r'^[a-zA-Z0-9_-]{11}$', url):
+    if validate_video_id(url):
         return url
     
     return None
@@ -525,12 +549,12 @@ def extract_channel_id_from_url(url: str) -> Optional[str]:
         Channel ID if found, None otherwise
     """
     # Channel ID pattern
-    channel_id_match = re.search(r'youtube\.com/channel/([a-zA-Z0-9_-]+)', url)
+    channel_id_match = _CHANNEL_URL_PATTERN.search(url)
     if channel_id_match:
         return channel_id_match.group(1)
     
     # If it's already just a channel ID
-    if re.match(r'^UC[a-zA-Z0-9_-]{22}$', url):
+    if validate_channel_id(url):
         return url
     
     return None
@@ -545,7 +569,7 @@ def validate_video_id(video_id: str) -> bool:
     Returns:
         True if valid format
     """
-    return bool(re.match(r'^[a-zA-Z0-9_-]{11}$', video_id))
+    return len(video_id) == 11 and _ID_CHARS.issuperset(video_id)
 
 
 def validate_channel_id(channel_id: str) -> bool:
@@ -557,4 +581,5 @@ def validate_channel_id(channel_id: str) -> bool:
     Returns:
         True if valid format
     """
-    return bool(re.match(r'^UC[a-zA-Z0-9_-]{22}$', channel_id))
+    return (len(channel_id) == 24 and channel_id.startswith('UC')
+            and _ID_CHARS.issuperset(channel_id))
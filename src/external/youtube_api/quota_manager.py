@@ -1,13 +1,15 @@
 """Enhanced quota management for YouTube API integration."""
 
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Collection
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, field
 from enum import Enum
+import atexit
 import json
 import logging
+import os
 import threading
-import time
+import weakref
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -38,6 +40,8 @@ class APIKeyInfo:
     is_active: bool = True
     error_count: int = 0
     last_error: Optional[datetime] = None
+    # Guards this key's counters; keys never contend with each other
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
     
     @property
     def remaining_quota(self) -> int:
@@ -56,38 +60,70 @@ class APIKeyInfo:
     
     def reset_daily_quota(self) -> None:
         """Reset daily quota usage."""
-        self.used_quota = 0
-        self.last_reset = datetime.now(timezone.utc)
-        self.error_count = 0
-        self.last_error = None
+        with self._lock:
+            self.used_quota = 0
+            self.last_reset = datetime.now(timezone.utc)
+            self.error_count = 0
+            self.last_error = None
         logger.info(f"Reset daily quota for API key: {self.name}")
     
     def add_usage(self, cost: int) -> None:
         """Add quota usage."""
-        self.used_quota += cost
+        with self._lock:
+            self.used_quota += cost
+        logger.debug(f"Added {cost} quota usage to {self.name}. Total: {self.used_quota}")
+    
+    def try_add_usage(self, cost: int) -> bool:
+        """Add quota usage only if enough quota remains.
+        
+        The check and the add are atomic with respect to other threads.
+        
+        Returns:
+            True if the usage was added
+        """
+        with self._lock:
+            if self.remaining_quota < cost:
+                return False
+            self.used_quota += cost
         logger.debug(f"Added {cost} quota usage to {self.name}. Total: {self.used_quota}")
+        return True
     
     def record_error(self) -> None:
         """Record an API error for this key."""
-        self.error_count += 1
-        self.last_error = datetime.now(timezone.utc)
-        
-        # Temporarily disable key if too many errors
-        if self.error_count >= 5:
-            self.is_active = False
+        with self._lock:
+            self.error_count += 1
+            self.last_error = datetime.now(timezone.utc)
+            
+            # Temporarily disable key if too many errors
+            disabled = self.error_count >= 5 and self.is_active
+            if disabled:
+                self.is_active = False
+        if disabled:
             logger.warning(f"Disabled API key {self.name} due to too many errors")
     
+    def enable(self) -> None:
+        """Re-activate this key and clear its error count."""
+        with self._lock:
+            self.is_active = True
+            self.error_count = 0
+    
+    def disable(self) -> None:
+        """Deactivate this key."""
+        with self._lock:
+            self.is_active = False
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            'name': self.name,
-            'daily_quota': self.daily_quota,
-            'used_quota': self.used_quota,
-            'last_reset': self.last_reset.isoformat(),
-            'is_active': self.is_active,
-            'error_count': self.error_count,
-            'last_error': self.last_error.isoformat() if self.last_error else None
-        }
+        with self._lock:
+            return {
+                'name': self.name,
+                'daily_quota': self.daily_quota,
+                'used_quota': self.used_quota,
+                'last_reset': self.last_reset.isoformat(),
+                'is_active': self.is_active,
+                'error_count': self.error_count,
+                'last_error': self.last_error.isoformat() if self.last_error else None
+            }
     
     @classmethod
     def from_dict(cls, key: str, data: Dict[str, Any]) -> 'APIKeyInfo':
@@ -112,23 +148,65 @@ class QuotaUsageStats:
     requests_by_endpoint: Dict[str, int] = field(default_factory=dict)
     quota_by_endpoint: Dict[str, int] = field(default_factory=dict)
     errors_by_key: Dict[str, int] = field(default_factory=dict)
+    # Held only for the few counter updates in add_request and for snapshots
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
     
     def add_request(self, endpoint: APIEndpoint, key_name: str, success: bool = True) -> None:
         """Record a request."""
-        self.total_requests += 1
-        self.total_quota_used += endpoint.quota_cost
-        
         endpoint_name = endpoint.endpoint_name
-        self.requests_by_endpoint[endpoint_name] = self.requests_by_endpoint.get(endpoint_name, 0) + 1
-        self.quota_by_endpoint[endpoint_name] = self.quota_by_endpoint.get(endpoint_name, 0) + endpoint.quota_cost
-        
-        if not success:
-            self.errors_by_key[key_name] = self.errors_by_key.get(key_name, 0) + 1
+        with self._lock:
+            self.total_requests += 1
+            self.total_quota_used += endpoint.quota_cost
+            
+            self.requests_by_endpoint[endpoint_name] = self.requests_by_endpoint.get(endpoint_name, 0) + 1
+            self.quota_by_endpoint[endpoint_name] = self.quota_by_endpoint.get(endpoint_name, 0) + endpoint.quota_cost
+            
+            if not success:
+                self.errors_by_key[key_name] = self.errors_by_key.get(key_name, 0) + 1
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Take a consistent copy of the counters for serialization."""
+        with self._lock:
+            return {
+                'total_requests': self.total_requests,
+                'total_quota_used': self.total_quota_used,
+                'requests_by_endpoint': dict(self.requests_by_endpoint),
+                'quota_by_endpoint': dict(self.quota_by_endpoint),
+                'errors_by_key': dict(self.errors_by_key)
+            }
+
+
+# Managers with a running flush thread; each is closed (and saved) at exit
+_live_managers: 'weakref.WeakSet[QuotaManager]' = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_managers() -> None:
+    for manager in list(_live_managers):
+        manager.close()
+
+
+def _flush_loop(manager_ref: 'weakref.ref[QuotaManager]', stop: threading.Event,
+                interval: float) -> None:
+    """Background saver: persist a manager's usage at most once per interval.
+    
+    Only a weak reference is held between saves, so an abandoned manager can
+    still be garbage collected; the thread then exits on its next tick.
+    """
+    while not stop.wait(interval):
+        manager = manager_ref()
+        if manager is None:
+            return
+        manager.flush()
+        del manager
 
 
 class QuotaManager:
     """Enhanced quota manager for YouTube API keys."""
     
+    # Usage changes are saved by a background thread at most this often
+    SAVE_INTERVAL_SECONDS = 5.0
+    
     def __init__(self, api_keys: Dict[str, str], storage_path: Optional[str] = None):
         """Initialize quota manager.
         
@@ -139,7 +217,11 @@ class QuotaManager:
         self.api_keys: Dict[str, APIKeyInfo] = {}
         self.storage_path = Path(storage_path) if storage_path else Path("data/quota_usage.json")
         self.stats = QuotaUsageStats()
-        self._lock = threading.Lock()
+        # Set on every change, cleared when a save snapshots the state
+        self._dirty = threading.Event()
+        # Serializes file writes between the flush thread and explicit flushes
+        self._save_lock = threading.Lock()
+        self._stop = threading.Event()
         
         # Initialize API keys
         for name, key in api_keys.items():
@@ -151,14 +233,27 @@ class QuotaManager:
         # Check for quota resets
         self._check_quota_resets()
         
+        # Persist usage in the background rather than on the request path
+        self._flush_thread = threading.Thread(
+            target=_flush_loop,
+            args=(weakref.ref(self), self._stop, self.SAVE_INTERVAL_SECONDS),
+            name="quota-flush",
+            daemon=True
+        )
+        self._flush_thread.start()
+        weakref.finalize(self, self._stop.set)
+        _live_managers.add(self)
+        
         logger.info(f"Initialized quota manager with {len(self.api_keys)} API keys")
     
-    def get_best_key_for_request(self, endpoint: APIEndpoint, required_quota: Optional[int] = None) -> Optional[APIKeyInfo]:
+    def get_best_key_for_request(self, endpoint: APIEndpoint, required_quota: Optional[int] = None,
+                                 exclude: Optional[Collection[str]] = None) -> Optional[APIKeyInfo]:
         """Get the best API key for a request.
         
         Args:
             endpoint: API endpoint to call
             required_quota: Required quota (defaults to endpoint cost)
+            exclude: Names of keys not to consider (e.g. already rejected)
             
         Returns:
             Best API key info or None if no key available
@@ -166,25 +261,28 @@ class QuotaManager:
         if required_quota is None:
             required_quota = endpoint.quota_cost
         
-        with self._lock:
-            # Filter available keys
-            available_keys = [
-                key_info for key_info in self.api_keys.values()
-                if key_info.is_quota_available and key_info.remaining_quota >= required_quota
-            ]
-            
-            if not available_keys:
-                logger.warning("No API keys with sufficient quota available")
-                return None
-            
-            # Sort by remaining quota (descending) and error count (ascending)
-            available_keys.sort(
-                key=lambda k: (-k.remaining_quota, k.error_count)
-            )
-            
-            best_key = available_keys[0]
-            logger.debug(f"Selected API key: {best_key.name} (remaining: {best_key.remaining_quota})")
-            return best_key
+        # Lock-free snapshot read: the choice is only a hint, reserve_quota
+        # re-checks the remaining quota under the key's own lock.
+        # Most remaining quota wins, then fewest errors; on a full tie the
+        # first key in insertion order is kept.
+        best_key = None
+        best_rank = None
+        for key_info in self.api_keys.values():
+            if exclude and key_info.name in exclude:
+                continue
+            remaining = key_info.remaining_quota
+            if not key_info.is_active or remaining <= 0 or remaining < required_quota:
+                continue
+            rank = (-remaining, key_info.error_count)
+            if best_rank is None or rank < best_rank:
+                best_key, best_rank = key_info, rank
+        
+        if best_key is None:
+            logger.warning("No API keys with sufficient quota available")
+            return None
+        
+        logger.debug(f"Selected API key: {best_key.name} (remaining: {best_key.remaining_quota})")
+        return best_key
     
     def reserve_quota(self, key_info: APIKeyInfo, endpoint: APIEndpoint) -> bool:
         """Reserve quota for a request.
@@ -196,13 +294,11 @@ class QuotaManager:
         Returns:
             True if quota reserved successfully
         """
-        with self._lock:
-            if key_info.remaining_quota >= endpoint.quota_cost:
-                key_info.add_usage(endpoint.quota_cost)
-                self.stats.add_request(endpoint, key_info.name, success=True)
-                self._save_usage_data()
-                return True
-            return False
+        if key_info.try_add_usage(endpoint.quota_cost):
+            self.stats.add_request(endpoint, key_info.name, success=True)
+            self._dirty.set()
+            return True
+        return False
     
     def record_request_success(self, key_info: APIKeyInfo, endpoint: APIEndpoint) -> None:
         """Record a successful API request.
@@ -222,12 +318,11 @@ class QuotaManager:
             endpoint: API endpoint
             error: Exception that occurred
         """
-        with self._lock:
-            key_info.record_error()
-            self.stats.add_request(endpoint, key_info.name, success=False)
-            self._save_usage_data()
-            
-            logger.error(f"Request error for {endpoint.endpoint_name} using {key_info.name}: {error}")
+        key_info.record_error()
+        self.stats.add_request(endpoint, key_info.name, success=False)
+        self._dirty.set()
+        
+        logger.error(f"Request error for {endpoint.endpoint_name} using {key_info.name}: {error}")
     
     def get_quota_summary(self) -> Dict[str, Any]:
         """Get quota usage summary.
@@ -235,36 +330,33 @@ class QuotaManager:
         Returns:
             Dictionary with quota usage information
         """
-        with self._lock:
-            total_quota = sum(key.daily_quota for key in self.api_keys.values())
-            total_used = sum(key.used_quota for key in self.api_keys.values())
-            total_remaining = sum(key.remaining_quota for key in self.api_keys.values())
-            
-            key_summaries = []
-            for key_info in self.api_keys.values():
-                key_summaries.append({
-                    'name': key_info.name,
-                    'quota_used': key_info.used_quota,
-                    'quota_remaining': key_info.remaining_quota,
-                    'usage_percentage': key_info.usage_percentage,
-                    'is_active': key_info.is_active,
-                    'error_count': key_info.error_count
-                })
-            
-            return {
-                'total_quota': total_quota,
-                'total_used': total_used,
-                'total_remaining': total_remaining,
-                'overall_usage_percentage': (total_used / total_quota * 100) if total_quota > 0 else 0,
-                'active_keys': sum(1 for k in self.api_keys.values() if k.is_active),
-                'keys': key_summaries,
-                'stats': {
-                    'total_requests': self.stats.total_requests,
-                    'total_quota_used': self.stats.total_quota_used,
-                    'requests_by_endpoint': self.stats.requests_by_endpoint,
-                    'quota_by_endpoint': self.stats.quota_by_endpoint
-                }
-            }
+        total_quota = sum(key.daily_quota for key in self.api_keys.values())
+        total_used = sum(key.used_quota for key in self.api_keys.values())
+        total_remaining = sum(key.remaining_quota for key in self.api_keys.values())
+        
+        key_summaries = []
+        for key_info in self.api_keys.values():
+            key_summaries.append({
+                'name': key_info.name,
+                'quota_used': key_info.used_quota,
+                'quota_remaining': key_info.remaining_quota,
+                'usage_percentage': key_info.usage_percentage,
+                'is_active': key_info.is_active,
+                'error_count': key_info.error_count
+            })
+        
+        stats = self.stats.to_dict()
+        del stats['errors_by_key']
+        
+        return {
+            'total_quota': total_quota,
+            'total_used': total_used,
+            'total_remaining': total_remaining,
+            'overall_usage_percentage': (total_used / total_quota * 100) if total_quota > 0 else 0,
+            'active_keys': sum(1 for k in self.api_keys.values() if k.is_active),
+            'keys': key_summaries,
+            'stats': stats
+        }
     
     def estimate_quota_cost(self, operation: str, **kwargs) -> int:
         """Estimate quota cost for an operation.
@@ -351,13 +443,12 @@ class QuotaManager:
         Returns:
             True if reset successful
         """
-        with self._lock:
-            if key_name in self.api_keys:
-                self.api_keys[key_name].reset_daily_quota()
-                self.api_keys[key_name].is_active = True
-                self._save_usage_data()
-                return True
-            return False
+        if key_name in self.api_keys:
+            self.api_keys[key_name].reset_daily_quota()
+            self.api_keys[key_name].enable()
+            self._dirty.set()
+            return True
+        return False
     
     def disable_key(self, key_name: str) -> bool:
         """Disable a specific API key.
@@ -368,13 +459,12 @@ class QuotaManager:
         Returns:
             True if disabled successfully
         """
-        with self._lock:
-            if key_name in self.api_keys:
-                self.api_keys[key_name].is_active = False
-                self._save_usage_data()
-                logger.info(f"Disabled API key: {key_name}")
-                return True
-            return False
+        if key_name in self.api_keys:
+            self.api_keys[key_name].disable()
+            self._dirty.set()
+            logger.info(f"Disabled API key: {key_name}")
+            return True
+        return False
     
     def enable_key(self, key_name: str) -> bool:
         """Enable a specific API key.
@@ -385,14 +475,12 @@ class QuotaManager:
         Returns:
             True if enabled successfully
         """
-        with self._lock:
-            if key_name in self.api_keys:
-                self.api_keys[key_name].is_active = True
-                self.api_keys[key_name].error_count = 0
-                self._save_usage_data()
-                logger.info(f"Enabled API key: {key_name}")
-                return True
-            return False
+        if key_name in self.api_keys:
+            self.api_keys[key_name].enable()
+            self._dirty.set()
+            logger.info(f"Enabled API key: {key_name}")
+            return True
+        return False
     
     def _check_quota_resets(self) -> None:
         """Check if any quotas need to be reset (daily reset at midnight PST)."""
@@ -437,29 +525,47 @@ class QuotaManager:
         except Exception as e:
             logger.warning(f"Failed to load quota usage data: {e}")
     
+    def flush(self) -> None:
+        """Persist any usage changes not yet written to storage."""
+        if self._dirty.is_set():
+            self._save_usage_data()
+    
+    def close(self) -> None:
+        """Stop the background flush thread and persist pending changes."""
+        self._stop.set()
+        _live_managers.discard(self)
+        self.flush()
+    
     def _save_usage_data(self) -> None:
-        """Save quota usage data to storage."""
-        try:
-            # Ensure directory exists
-            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-            
+        """Save quota usage data to storage.
+    
+        Each key and the stats are snapshotted under their own locks;
+        encoding and file I/O hold none of them, so requests never wait on
+        the disk.
+        """
+        with self._save_lock:
+            # Clear first: a change racing with the snapshot re-marks it dirty
+            self._dirty.clear()
             data = {
                 'keys': {name: key_info.to_dict() for name, key_info in self.api_keys.items()},
-                'stats': {
-                    'total_requests': self.stats.total_requests,
-                    'total_quota_used': self.stats.total_quota_used,
-                    'requests_by_endpoint': self.stats.requests_by_endpoint,
-                    'quota_by_endpoint': self.stats.quota_by_endpoint,
-                    'errors_by_key': self.stats.errors_by_key
-                },
+                'stats': self.stats.to_dict(),
                 'last_updated': datetime.now(timezone.utc).isoformat()
             }
             
-            with open(self.storage_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            try:
+                # Ensure directory exists
+                self.storage_path.parent.mkdir(parents=True, exist_ok=True)
                 
-        except Exception as e:
-            logger.error(f"Failed to save quota usage data: {e}")
+                # Write then rename so readers never see a half-written file
+                tmp_path = self.storage_path.with_name(self.storage_path.name + '.tmp')
+                with open(tmp_path, 'w') as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp_path, self.storage_path)
+                
+            except Exception as e:
+                # Leave the changes pending so the next flush retries them
+                self._dirty.set()
+                logger.error(f"Failed to save quota usage data: {e}")
     
     def __enter__(self):
         """Context manager entry."""
@@ -467,7 +573,7 @@ class QuotaManager:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - save data."""
-        self._save_usage_data()
+        self.flush()
 
 
 class QuotaMonitor:
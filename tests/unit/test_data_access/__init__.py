@@ -0,0 +1 @@
+# Data Access Unit Tests
@@ -0,0 +1,95 @@
+"""
+Unit Tests for User Repository
+
+This module contains unit tests for UserRepository authentication and its
+throttled last_login writes, run against an in-memory SQLite database.
+
+Author: ViewTrendsSL Team
+Date: 2025
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.data_access.models import Base, User
+from src.data_access.repositories.user import user_repository
+from src.data_access.repositories.user.user_repository import UserRepository
+
+LOGIN_TIME = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def session():
+    """Create a session on a fresh in-memory database."""
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def user(session):
+    """Create a user with a known updated_at."""
+    user = User('user@example.com', 'secret')
+    user.updated_at = datetime(2024, 6, 1)
+    session.add(user)
+    session.flush()
+    return user
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Control the time seen by the repository."""
+    now = {'value': LOGIN_TIME}
+    monkeypatch.setattr(user_repository, 'get_current_utc_time', lambda: now['value'])
+    return now
+
+
+class TestAuthenticateUser:
+    """Test cases for UserRepository.authenticate_user."""
+    
+    @pytest.fixture
+    def repository(self):
+        """Create UserRepository instance."""
+        return UserRepository()
+    
+    def _stored(self, session, user):
+        """Reload the user's row from the database."""
+        session.expire_all()
+        return session.get(User, user.id)
+    
+    def test_first_login_recorded_without_touching_updated_at(self, repository, session, user, clock):
+        """Test that a login writes last_login but is not a profile change."""
+        authenticated = repository.authenticate_user(user.email, user.password_hash, session=session)
+        
+        assert authenticated is not None
+        stored = self._stored(session, user)
+        assert stored.last_login == LOGIN_TIME.replace(tzinfo=None)
+        assert stored.updated_at == datetime(2024, 6, 1)
+    
+    def test_repeat_login_within_interval_not_written(self, repository, session, user, clock):
+        """Test that logins inside LAST_LOGIN_WRITE_INTERVAL skip the write."""
+        repository.authenticate_user(user.email, user.password_hash, session=session)
+        clock['value'] = LOGIN_TIME + timedelta(minutes=4)
+        repository.authenticate_user(user.email, user.password_hash, session=session)
+        
+        assert self._stored(session, user).last_login == LOGIN_TIME.replace(tzinfo=None)
+    
+    def test_login_after_interval_written(self, repository, session, user, clock):
+        """Test that a login after the interval updates last_login again."""
+        repository.authenticate_user(user.email, user.password_hash, session=session)
+        later = LOGIN_TIME + user_repository.LAST_LOGIN_WRITE_INTERVAL + timedelta(seconds=1)
+        clock['value'] = later
+        repository.authenticate_user(user.email, user.password_hash, session=session)
+        
+        stored = self._stored(session, user)
+        assert stored.last_login == later.replace(tzinfo=None)
+        assert stored.updated_at == datetime(2024, 6, 1)
+    
+    def test_wrong_password_not_authenticated(self, repository, session, user, clock):
+        """Test that a failed login returns None and records nothing."""
+        assert repository.authenticate_user(user.email, 'not-the-hash', session=session) is None
+        assert self._stored(session, user).last_login is None
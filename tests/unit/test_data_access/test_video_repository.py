@@ -0,0 +1,189 @@
+"""
+Unit Tests for Video Repository
+
+This module contains unit tests for VideoRepository tag queries, run
+against an in-memory SQLite database.
+
+Author: ViewTrendsSL Team
+Date: 2025
+"""
+
+import pytest
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.data_access.models import Base, Channel, Video, Tag, VideoTag
+from src.data_access.repositories.video.video_repository import VideoRepository
+
+
+@pytest.fixture
+def session():
+    """Create a session on a fresh in-memory database."""
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def tagged_videos(session):
+    """Create videos tagged as follows (views in brackets).
+    
+    a (300): cricket, sri lanka
+    b (200): cricket
+    c (100): sri lanka, cricket, deleted
+    d (50):  no tags
+    """
+    channel = Channel(channel_id='UC' + 'a' * 22, title='Channel')
+    session.add(channel)
+    session.flush()
+    
+    tags = {name: Tag(name) for name in ('Cricket', 'Sri Lanka')}
+    session.add_all(tags.values())
+    
+    videos = {}
+    for key, views, is_deleted in (('a', 300, False), ('b', 200, False),
+                                   ('c', 100, True), ('d', 50, False)):
+        video = Video(video_id=key * 11, channel_id=channel.id, title=f'Video {key}',
+                      published_at=datetime(2025, 1, 1), view_count=views,
+                      is_deleted=is_deleted)
+        videos[key] = video
+    session.add_all(videos.values())
+    session.flush()
+    
+    for key, tag_names in (('a', ['Cricket', 'Sri Lanka']), ('b', ['Cricket']),
+                           ('c', ['Sri Lanka', 'Cricket'])):
+        for name in tag_names:
+            session.add(VideoTag(video_id=videos[key].id, tag_id=tags[name].id))
+    session.flush()
+    return videos
+
+
+class TestGetVideosWithTags:
+    """Test cases for VideoRepository.get_videos_with_tags."""
+    
+    @pytest.fixture
+    def repository(self, session):
+        """Create VideoRepository instance."""
+        return VideoRepository(session)
+    
+    @pytest.mark.parametrize('match_all', [False, True])
+    def test_empty_tag_list_returns_nothing(self, repository, tagged_videos, match_all):
+        """Test that no tags matches no videos rather than all of them."""
+        assert repository.get_videos_with_tags([], match_all=match_all) == []
+    
+    def test_any_tag_returns_each_video_once(self, repository, tagged_videos):
+        """Test that a video with several matching tags is not duplicated."""
+        videos = repository.get_videos_with_tags(['cricket', 'sri lanka'])
+        
+        assert [video.video_id for video in videos] == ['a' * 11, 'b' * 11]
+    
+    def test_all_tags_required(self, repository, tagged_videos):
+        """Test that match_all only returns videos carrying every tag."""
+        videos = repository.get_videos_with_tags(['cricket', 'sri lanka'], match_all=True)
+        
+        assert [video.video_id for video in videos] == ['a' * 11]
+    
+    def test_tag_names_normalized(self, repository, tagged_videos):
+        """Test case-insensitive, whitespace-trimmed and duplicate tag names."""
+        videos = repository.get_videos_with_tags(['  CRICKET ', 'Sri Lanka', 'cricket'],
+                                                 match_all=True)
+        
+        assert [video.video_id for video in videos] == ['a' * 11]
+    
+    def test_unknown_tag(self, repository, tagged_videos):
+        """Test that a tag no video carries matches nothing."""
+        assert repository.get_videos_with_tags(['football']) == []
+        assert repository.get_videos_with_tags(['cricket', 'football'], match_all=True) == []
+
+
+class TestGetVideosByChannel:
+    """Test cases for keyset pagination in VideoRepository.get_videos_by_channel."""
+    
+    @pytest.fixture
+    def repository(self, session):
+        """Create VideoRepository instance."""
+        return VideoRepository(session)
+    
+    @pytest.fixture
+    def channel_videos(self, session):
+        """Create five videos, three of them uploaded in the same second."""
+        channel = Channel(channel_id='UC' + 'b' * 22, title='Batch uploader')
+        session.add(channel)
+        session.flush()
+        
+        timestamps = [datetime(2025, 1, 3), datetime(2025, 1, 2), datetime(2025, 1, 2),
+                      datetime(2025, 1, 2), datetime(2025, 1, 1)]
+        videos = [
+            Video(video_id=f'video{index:06d}', channel_id=channel.id,
+                  title=f'Video {index}', published_at=published_at)
+            for index, published_at in enumerate(timestamps)
+        ]
+        session.add_all(videos)
+        session.flush()
+        return channel, videos
+    
+    def test_pages_keep_videos_sharing_boundary_timestamp(self, repository, channel_videos):
+        """Test that a page boundary inside a same-timestamp batch skips nothing."""
+        channel, videos = channel_videos
+        seen = []
+        cursor = {}
+        
+        while True:
+            page = repository.get_videos_by_channel(channel.id, limit=2, **cursor)
+            if not page:
+                break
+            seen.extend(page)
+            cursor = {'before_published_at': page[-1].published_at, 'before_id': page[-1].id}
+        
+        assert len(seen) == len(videos)
+        assert {video.id for video in seen} == {video.id for video in videos}
+        assert [video.published_at for video in seen] == sorted(
+            (video.published_at for video in videos), reverse=True
+        )
+    
+    def test_same_timestamp_ordered_by_id(self, repository, channel_videos):
+        """Test the (published_at, id) tie-break order."""
+        channel, videos = channel_videos
+        page = repository.get_videos_by_channel(channel.id)
+        
+        assert [video.id for video in page] == [
+            videos[0].id, videos[3].id, videos[2].id, videos[1].id, videos[4].id
+        ]
+
+
+class TestLoggedQuery:
+    """Test cases for failure logging in decorated VideoRepository methods."""
+    
+    @pytest.fixture
+    def repository(self, session):
+        """Create VideoRepository instance."""
+        return VideoRepository(session)
+    
+    def test_nested_failure_logged_once(self, repository, monkeypatch, caplog):
+        """Test that a failure inside a nested decorated call is logged by the outer one only."""
+        def fail(*args, **kwargs):
+            raise RuntimeError('connection lost')
+        monkeypatch.setattr(repository.session, 'scalars', fail)
+        
+        with pytest.raises(RuntimeError):
+            repository.update_video_statistics('a' * 11, 100)
+        
+        errors = [record.getMessage() for record in caplog.records if record.levelname == 'ERROR']
+        assert errors == ['Error updating video statistics: connection lost']
+    
+    def test_training_stream_failure_logged(self, repository, monkeypatch, caplog):
+        """Test that errors raised while iterating a training stream are logged."""
+        def fail(*args, **kwargs):
+            raise RuntimeError('connection lost')
+        monkeypatch.setattr(repository.session, 'query', fail)
+        
+        rows = repository.iter_training_rows()
+        assert not caplog.records
+        with pytest.raises(RuntimeError):
+            list(rows)
+        
+        errors = [record.getMessage() for record in caplog.records if record.levelname == 'ERROR']
+        assert errors == ['Error streaming training rows: connection lost']
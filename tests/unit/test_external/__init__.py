@@ -0,0 +1 @@
+# External API Unit Tests
@@ -0,0 +1,131 @@
+"""
+Unit Tests for Quota Manager
+
+This module contains unit tests for QuotaManager key selection, per-key
+quota reservation under concurrency, and usage persistence.
+
+Author: ViewTrendsSL Team
+Date: 2025
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.external.youtube_api.quota_manager import APIKeyInfo, APIEndpoint, QuotaManager
+
+
+@pytest.fixture
+def quota_manager(tmp_path):
+    """Create a quota manager with two keys of 1000 units each."""
+    manager = QuotaManager({'key1': 'k1', 'key2': 'k2'}, str(tmp_path / 'quota.json'))
+    for key_info in manager.api_keys.values():
+        key_info.daily_quota = 1000
+    yield manager
+    manager.close()
+
+
+class TestTryAddUsage:
+    """Test cases for APIKeyInfo.try_add_usage."""
+    
+    def test_rejects_cost_above_remaining(self):
+        """Test that usage is only added while quota remains."""
+        key_info = APIKeyInfo(key='k', name='key', daily_quota=150)
+        
+        assert key_info.try_add_usage(100)
+        assert not key_info.try_add_usage(100)
+        assert key_info.used_quota == 100
+    
+    def test_concurrent_reservations_never_overspend(self):
+        """Test that check-and-add stays atomic across threads."""
+        key_info = APIKeyInfo(key='k', name='key', daily_quota=5000)
+        barrier = threading.Barrier(8)
+        
+        def reserve(_):
+            barrier.wait()
+            return sum(key_info.try_add_usage(1) for _ in range(1000))
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            granted = sum(executor.map(reserve, range(8)))
+        
+        assert granted == 5000
+        assert key_info.used_quota == 5000
+
+
+class TestQuotaManager:
+    """Test cases for QuotaManager."""
+    
+    def test_concurrent_requests_spread_over_keys(self, quota_manager):
+        """Test that parallel select-and-reserve uses all quota exactly once."""
+        def request(_):
+            key_info = quota_manager.get_best_key_for_request(APIEndpoint.VIDEOS_LIST)
+            return bool(key_info and quota_manager.reserve_quota(key_info, APIEndpoint.VIDEOS_LIST))
+        
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            granted = sum(executor.map(request, range(2500)))
+        
+        summary = quota_manager.get_quota_summary()
+        assert granted == 2000
+        assert summary['total_used'] == 2000
+        assert summary['stats']['total_requests'] == 2000
+    
+    def test_best_key_prefers_remaining_then_errors(self, quota_manager):
+        """Test key ranking, exclusion and the required quota check."""
+        key1, key2 = quota_manager.api_keys['key1'], quota_manager.api_keys['key2']
+        key1.used_quota = 100
+        assert quota_manager.get_best_key_for_request(APIEndpoint.VIDEOS_LIST) is key2
+        
+        key1.used_quota = 0
+        key2.error_count = 1
+        assert quota_manager.get_best_key_for_request(APIEndpoint.VIDEOS_LIST) is key1
+        assert quota_manager.get_best_key_for_request(
+            APIEndpoint.VIDEOS_LIST, exclude={'key1'}
+        ) is key2
+        assert quota_manager.get_best_key_for_request(APIEndpoint.VIDEOS_LIST, required_quota=1001) is None
+    
+    def test_errors_disable_key_until_enabled(self, quota_manager):
+        """Test that five errors disable a key and enable_key restores it."""
+        key_info = quota_manager.api_keys['key1']
+        for _ in range(5):
+            quota_manager.record_request_error(key_info, APIEndpoint.VIDEOS_LIST, Exception('boom'))
+        
+        assert not key_info.is_active
+        assert quota_manager.get_best_key_for_request(APIEndpoint.VIDEOS_LIST).name == 'key2'
+        
+        quota_manager.enable_key('key1')
+        assert key_info.is_active
+        assert key_info.error_count == 0
+    
+    def test_disable_and_reset_key(self, quota_manager):
+        """Test that disable_key and reset_key_quota toggle the key's active flag."""
+        key_info = quota_manager.api_keys['key1']
+        key_info.add_usage(500)
+        
+        assert quota_manager.disable_key('key1')
+        assert not key_info.is_active
+        assert quota_manager.get_best_key_for_request(APIEndpoint.VIDEOS_LIST).name == 'key2'
+        
+        assert quota_manager.reset_key_quota('key1')
+        assert key_info.is_active
+        assert key_info.used_quota == 0
+        assert not quota_manager.disable_key('missing')
+    
+    def test_close_persists_pending_usage(self, quota_manager):
+        """Test that close() writes usage the flush thread has not saved yet."""
+        key_info = quota_manager.get_best_key_for_request(APIEndpoint.SEARCH_LIST)
+        quota_manager.reserve_quota(key_info, APIEndpoint.SEARCH_LIST)
+        quota_manager.close()
+        
+        with open(quota_manager.storage_path) as f:
+            data = json.load(f)
+        assert data['keys'][key_info.name]['used_quota'] == 100
+        assert data['stats']['quota_by_endpoint'] == {'search': 100}
+        
+        quota_manager._flush_thread.join(timeout=1)
+        assert not quota_manager._flush_thread.is_alive()
+        
+        reloaded = QuotaManager({'key1': 'k1', 'key2': 'k2'}, str(quota_manager.storage_path))
+        assert reloaded.api_keys[key_info.name].used_quota == 100
+        reloaded.close()
@@ -0,0 +1,265 @@
+"""
+Unit Tests for YouTube API Client
+
+This module contains unit tests for the YouTubeAPIClient single-resource
+response cache and its ETag revalidation, using a mocked HTTP transport.
+
+Author: ViewTrendsSL Team
+Date: 2025
+"""
+
+import threading
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from src.external.youtube_api.client import YouTubeAPIClient, YouTubeAPIClientSync
+from src.external.youtube_api.exceptions import QuotaExceededError, RateLimitError
+
+pytestmark = pytest.mark.asyncio
+
+VIDEO_ID = 'dQw4w9WgXcQ'
+KEY1 = 'AIzaSy' + 'a' * 33
+KEY2 = 'AIzaSy' + 'b' * 33
+
+
+def _video_item(video_id, title):
+    """Build a videos.list item."""
+    return {
+        'kind': 'youtube#video',
+        'etag': 'item-etag',
+        'id': video_id,
+        'snippet': {
+            'publishedAt': '2024-01-01T00:00:00Z',
+            'channelId': 'UC' + 'a' * 22,
+            'title': title,
+            'description': '',
+            'channelTitle': 'Channel',
+            'thumbnails': {'default': {'url': 'https://i.ytimg.com/vi/x/default.jpg'}},
+            'categoryId': '22'
+        },
+        'statistics': {'viewCount': '10'},
+        'contentDetails': {'duration': 'PT1M5S'}
+    }
+
+
+class FakeVideosAPI:
+    """Serves videos.list with an ETag and honours If-None-Match.
+    
+    Keys listed in ``errors_by_key`` are answered with that (status, reason).
+    """
+    
+    def __init__(self):
+        self.etag = '"v1"'
+        self.title = 'First title'
+        self.requests = []
+        self.errors_by_key = {}
+    
+    def handler(self, request):
+        self.requests.append(request)
+        error = self.errors_by_key.get(request.url.params['key'])
+        if error is not None:
+            status, reason = error
+            return httpx.Response(status, json={'error': {
+                'code': status, 'message': reason,
+                'errors': [{'reason': reason, 'message': reason}]
+            }})
+        if request.headers.get('If-None-Match') == self.etag:
+            return httpx.Response(304)
+        ids = request.url.params['id'].split(',')
+        return httpx.Response(200, json={
+            'kind': 'youtube#videoListResponse',
+            'etag': self.etag,
+            'pageInfo': {'totalResults': len(ids), 'resultsPerPage': len(ids)},
+            'items': [_video_item(video_id, self.title) for video_id in ids]
+        })
+
+
+@pytest.fixture
+def api():
+    """Create the fake videos endpoint."""
+    return FakeVideosAPI()
+
+
+@pytest_asyncio.fixture
+async def client(api, tmp_path):
+    """Create a client whose HTTP calls go to the fake endpoint."""
+    client = YouTubeAPIClient(
+        {'key1': KEY1, 'key2': KEY2},
+        quota_storage_path=str(tmp_path / 'quota.json')
+    )
+    await client.client.aclose()
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(api.handler))
+    yield client
+    await client.close()
+
+
+class TestResponseCache:
+    """Test cases for the ETag-revalidated response cache."""
+    
+    async def test_fresh_entry_served_without_request(self, client, api):
+        """Test that a second fetch within the TTL makes no request."""
+        first = await client.get_video(VIDEO_ID)
+        second = await client.get_video(VIDEO_ID)
+        
+        assert len(api.requests) == 1
+        assert second is first
+        assert 'If-None-Match' not in api.requests[0].headers
+    
+    async def test_stale_entry_revalidated_with_304(self, client, api):
+        """Test that an expired entry sends its ETag and is kept on 304."""
+        client.RESPONSE_CACHE_TTL = 0
+        first = await client.get_video(VIDEO_ID)
+        second = await client.get_video(VIDEO_ID)
+        
+        assert len(api.requests) == 2
+        assert api.requests[1].headers['If-None-Match'] == '"v1"'
+        assert second is first
+    
+    async def test_stale_entry_replaced_when_changed(self, client, api):
+        """Test that a changed resource replaces the cached item and ETag."""
+        client.RESPONSE_CACHE_TTL = 0
+        await client.get_video(VIDEO_ID)
+        
+        api.etag = '"v2"'
+        api.title = 'Second title'
+        changed = await client.get_video(VIDEO_ID)
+        assert changed.snippet.title == 'Second title'
+        
+        await client.get_video(VIDEO_ID)
+        assert api.requests[2].headers['If-None-Match'] == '"v2"'
+    
+    async def test_304_still_charges_quota(self, client, api):
+        """Test that a revalidation is counted like any other request."""
+        client.RESPONSE_CACHE_TTL = 0
+        await client.get_video(VIDEO_ID)
+        await client.get_video(VIDEO_ID)
+        
+        assert client.quota_manager.get_quota_summary()['total_used'] == 2
+    
+    async def test_least_recently_used_entry_evicted(self, client, api):
+        """Test that the cache drops the least recently used entry when full."""
+        client.RESPONSE_CACHE_MAX_ENTRIES = 2
+        await client.get_video('aaaaaaaaaa1')
+        await client.get_video('bbbbbbbbbb2')
+        await client.get_video('aaaaaaaaaa1')
+        await client.get_video('cccccccccc3')
+        
+        await client.get_video('aaaaaaaaaa1')
+        assert len(api.requests) == 3
+        
+        await client.get_video('bbbbbbbbbb2')
+        assert len(api.requests) == 4
+
+
+class TestVideoFieldMask:
+    """Test cases for the default videos.list partial-response mask."""
+    
+    async def test_default_parts_use_field_mask(self, client, api):
+        """Test that default requests send VIDEO_FIELDS."""
+        await client.get_video(VIDEO_ID)
+        await client.get_videos(['aaaaaaaaaa1'])
+        
+        for request in api.requests:
+            assert request.url.params['fields'] == YouTubeAPIClient.VIDEO_FIELDS
+    
+    async def test_extra_parts_not_masked(self, client, api):
+        """Test that parts outside VIDEO_FIELDS are not stripped by the mask."""
+        parts = ['snippet', 'status', 'topicDetails']
+        await client.get_video(VIDEO_ID, parts=parts)
+        await client.get_videos(['aaaaaaaaaa1'], parts=parts)
+        
+        for request in api.requests:
+            assert request.url.params['part'] == 'snippet,status,topicDetails'
+            assert 'fields' not in request.url.params
+    
+    async def test_explicit_fields_kept(self, client, api):
+        """Test that a caller's own mask is sent unchanged."""
+        await client.get_video(VIDEO_ID, parts=['snippet', 'status'], fields='items(id,status)')
+        
+        assert api.requests[0].url.params['fields'] == 'items(id,status)'
+
+
+class TestKeyHopping:
+    """Test cases for switching API keys on quota and rate limit errors."""
+    
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        """Record retry sleeps instead of waiting."""
+        sleeps = []
+        
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+        
+        monkeypatch.setattr('src.external.youtube_api.client.asyncio.sleep', fake_sleep)
+        return sleeps
+    
+    @pytest.mark.parametrize('status, reason', [
+        (403, 'quotaExceeded'),
+        (429, 'rateLimitExceeded'),
+    ])
+    async def test_switches_key_without_sleeping(self, client, api, no_sleep, status, reason):
+        """Test that a quota or rate limit on one key moves to the other at once."""
+        api.errors_by_key[KEY1] = (status, reason)
+        video = await client.get_video(VIDEO_ID)
+        
+        assert video.id == VIDEO_ID
+        assert [request.url.params['key'] for request in api.requests] == [KEY1, KEY2]
+        assert no_sleep == []
+        assert client.quota_manager.api_keys['key2'].used_quota == 1
+    
+    async def test_quota_error_raised_when_every_key_is_exhausted(self, client, api, no_sleep):
+        """Test that quota errors on all keys are raised rather than retried."""
+        api.errors_by_key[KEY1] = (403, 'quotaExceeded')
+        api.errors_by_key[KEY2] = (403, 'quotaExceeded')
+        
+        with pytest.raises(QuotaExceededError):
+            await client.get_video(VIDEO_ID)
+        
+        assert len(api.requests) == 2
+        assert no_sleep == []
+    
+    async def test_rate_limit_backs_off_once_keys_are_tried(self, client, api, no_sleep):
+        """Test that rate limits fall back to jittered backoff after trying every key."""
+        api.errors_by_key[KEY1] = (429, 'rateLimitExceeded')
+        api.errors_by_key[KEY2] = (429, 'rateLimitExceeded')
+        
+        with pytest.raises(RateLimitError):
+            await client.get_video(VIDEO_ID)
+        
+        assert len(api.requests) == client.max_retries + 1
+        assert no_sleep
+        assert all(
+            client.RETRY_BASE_DELAY <= delay <= client.RETRY_MAX_DELAY for delay in no_sleep
+        )
+
+
+class TestSyncClient:
+    """Test cases for the synchronous wrapper."""
+    
+    async def test_concurrent_callers_share_one_client(self, tmp_path):
+        """Test that threads racing on first use get the same async client."""
+        sync_client = YouTubeAPIClientSync(
+            {'key1': KEY1}, quota_storage_path=str(tmp_path / 'quota.json')
+        )
+        barrier = threading.Barrier(8)
+        clients = []
+        
+        def get_client():
+            barrier.wait()
+            clients.append(sync_client._get_client())
+        
+        threads = [threading.Thread(target=get_client) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        try:
+            assert len({id(client) for client in clients}) == 1
+            assert sync_client._loop is not None
+        finally:
+            sync_client.close()
+        
+        assert sync_client._client is None
@@ -0,0 +1,150 @@
+"""
+Unit Tests for YouTube API Exceptions
+
+This module contains unit tests for parse_youtube_api_error and the
+exception hierarchy it dispatches to.
+
+Author: ViewTrendsSL Team
+Date: 2025
+"""
+
+import pickle
+
+import pytest
+
+from src.external.youtube_api.exceptions import (
+    parse_youtube_api_error,
+    is_retryable_error,
+    YouTubeAPIError,
+    QuotaExceededError,
+    AuthenticationError,
+    RateLimitError,
+    VideoNotFoundError,
+    ChannelNotFoundError,
+    InvalidRequestError,
+    ServerError,
+    ServiceUnavailableError,
+)
+
+
+def _error_response(code, message, reason=None):
+    """Build a YouTube API error body."""
+    error = {'code': code, 'message': message}
+    if reason:
+        error['errors'] = [{'reason': reason, 'message': message}]
+    return {'error': error}
+
+
+class TestErrorDispatch:
+    """Test cases for mapping API error responses to exception types."""
+    
+    @pytest.mark.parametrize('reason, expected_type', [
+        ('quotaExceeded', QuotaExceededError),
+        ('dailyLimitExceeded', QuotaExceededError),
+        ('keyInvalid', AuthenticationError),
+        ('rateLimitExceeded', RateLimitError),
+        ('videoNotFound', VideoNotFoundError),
+        ('channelNotFound', ChannelNotFoundError),
+    ])
+    def test_dispatch_by_reason(self, reason, expected_type):
+        """Test that the error reason decides the type, whatever the code."""
+        error = parse_youtube_api_error(_error_response(400, 'Failed', reason), 400)
+        
+        assert type(error) is expected_type
+        assert error.reason == reason
+        assert error.message == 'Failed'
+    
+    @pytest.mark.parametrize('code, expected_type', [
+        (400, InvalidRequestError),
+        (401, AuthenticationError),
+        (403, QuotaExceededError),
+        (429, RateLimitError),
+        (500, ServerError),
+        (502, ServerError),
+        (503, ServiceUnavailableError),
+    ])
+    def test_dispatch_by_status_code(self, code, expected_type):
+        """Test that the status code decides the type without a known reason."""
+        error = parse_youtube_api_error(_error_response(code, 'Failed', 'someOtherReason'), code)
+        
+        assert type(error) is expected_type
+        assert error.reason == 'someOtherReason'
+    
+    def test_code_in_body_wins_over_status_code(self):
+        """Test that the error body's code is used when present."""
+        error = parse_youtube_api_error(_error_response(429, 'Slow down'), 500)
+        
+        assert isinstance(error, RateLimitError)
+    
+    def test_unknown_error_keeps_response_data(self):
+        """Test the generic fallback for unmapped codes."""
+        response = _error_response(418, "I'm a teapot")
+        error = parse_youtube_api_error(response, 418)
+        
+        assert type(error) is YouTubeAPIError
+        assert error.status_code == 418
+        assert error.response_data == response
+    
+    def test_missing_error_body(self):
+        """Test parsing a response without an error object."""
+        error = parse_youtube_api_error({}, 502)
+        
+        assert isinstance(error, ServerError)
+        assert error.message == 'Unknown YouTube API error'
+    
+    @pytest.mark.parametrize('code, retryable', [
+        (400, False),
+        (403, False),
+        (429, True),
+        (500, True),
+        (503, True),
+    ])
+    def test_retryable_by_status_code(self, code, retryable):
+        """Test retryability of the dispatched error types."""
+        error = parse_youtube_api_error(_error_response(code, 'Failed'), code)
+        
+        assert is_retryable_error(error) is retryable
+    
+    def test_parsed_error_survives_pickling(self):
+        """Test that slotted errors round-trip through pickle."""
+        error = parse_youtube_api_error(_error_response(503, 'Busy', 'backendError'), 503)
+        restored = pickle.loads(pickle.dumps(error))
+        
+        assert type(restored) is ServiceUnavailableError
+        assert restored.message == 'Busy'
+        assert restored.status_code == 503
+        assert restored.reason == 'backendError'
+        assert restored.to_dict() == error.to_dict()
+
+
+class TestNotFoundParsing:
+    """Test cases for 404 not-found dispatch and ID extraction."""
+    
+    def test_plain_word_is_not_taken_as_video_id(self):
+        """Test that an 11-letter word in the message is not used as the ID."""
+        message = 'Video not found: the requested resource is unavailable'
+        error = parse_youtube_api_error(_error_response(404, message), 404)
+        
+        assert isinstance(error, VideoNotFoundError)
+        assert error.video_id == 'unknown'
+        assert error.message == message
+    
+    @pytest.mark.parametrize('message, expected_id', [
+        ('Video not found: dQw4w9WgXcQ', 'dQw4w9WgXcQ'),
+        ('Video with id abcdefghijk was not found', 'abcdefghijk'),
+        ("Video 'abcdefghijk' not found", 'abcdefghijk'),
+    ])
+    def test_video_id_extracted(self, message, expected_id):
+        """Test extraction of video IDs that look like real IDs."""
+        error = parse_youtube_api_error(_error_response(404, message), 404)
+        
+        assert isinstance(error, VideoNotFoundError)
+        assert error.video_id == expected_id
+    
+    def test_channel_id_extracted(self):
+        """Test extraction of a UC... channel ID."""
+        message = 'Channel not found: UCx_yz-0123456789abcdefg'
+        error = parse_youtube_api_error(_error_response(404, message), 404)
+        
+        assert isinstance(error, ChannelNotFoundError)
+        assert error.channel_id == 'UCx_yz-0123456789abcdefg'